@@ -6,6 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 
 CONFLICT_POLICY_RENAME = "rename"
@@ -42,12 +43,16 @@ def build_numbered_name(path: Path, counter: int) -> Path:
     return path.parent / f"{stem} ({counter}){suffix}"
 
 
-def find_available_name(path: Path) -> Path:
-    if not path.exists():
+def find_available_name(
+    path: Path, exists: Callable[[Path], bool] | None = None
+) -> Path:
+    """Primer nombre libre; ``exists`` permite consultar un índice en memoria."""
+    exists = exists or Path.exists
+    if not exists(path):
         return path
     counter = 1
     candidate = build_numbered_name(path, counter)
-    while candidate.exists():
+    while exists(candidate):
         counter += 1
         candidate = build_numbered_name(path, counter)
     return candidate
@@ -61,9 +66,10 @@ def resolve_destination(
     base_destination: Path,
     conflict_policy: str = CONFLICT_POLICY_RENAME,
     is_folder: bool = False,
+    exists: Callable[[Path], bool] | None = None,
 ) -> ConflictResolution:
-    exists = base_destination.exists()
-    if not exists:
+    exists = exists or Path.exists
+    if not exists(base_destination):
         return ConflictResolution(
             destination=base_destination,
             status="Sin conflicto",
@@ -72,7 +78,7 @@ def resolve_destination(
         )
 
     if is_folder or conflict_policy == CONFLICT_POLICY_RENAME:
-        destination = find_available_name(base_destination)
+        destination = find_available_name(base_destination, exists)
         return ConflictResolution(
             destination=destination,
             status=f"Se renombrará a {destination.name}",
@@ -4,12 +4,16 @@ Sistema de Transacciones y Rollback para el Organizador de Archivos
 Permite deshacer operaciones de movimiento/eliminación de archivos
 """
 
+import errno
 import json
 import shutil
 import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import Deque, List, Dict, Any, Optional, Tuple
+from datetime import date, datetime
 from enum import Enum
 
 from src.utils.logger import error, warn, success
@@ -24,6 +28,109 @@ class OperationType(Enum):
     CREATE_DIR = "create_dir"
 
 
+# Valores de tipo precalculados para los bucles sobre el log
+_TYPE_MOVE = OperationType.MOVE.value
+_TYPE_DELETE = OperationType.DELETE.value
+_TYPE_RENAME = OperationType.RENAME.value
+_TYPE_CREATE_DIR = OperationType.CREATE_DIR.value
+
+# Marcadores de transacción
+_TXN_BEGIN = "transaction_begin"
+_TXN_COMMIT = "transaction_commit"
+_TXN_ROLLBACK = "transaction_rollback"
+
+# Tipos de entrada que representan operaciones reales sobre archivos
+_OPERATION_TYPES = frozenset(
+    (_TYPE_MOVE, _TYPE_DELETE, _TYPE_RENAME, _TYPE_CREATE_DIR)
+)
+
+# Tipos de entrada del log con contador propio para get_statistics()
+_COUNTED_TYPES = tuple(_OPERATION_TYPES) + (_TXN_BEGIN, _TXN_ROLLBACK)
+
+
+def _iso_to_epoch(timestamp: Optional[str]) -> float:
+    """Convierte un timestamp ISO a segundos epoch (0.0 si no es válido)"""
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_jsonl(entry: Dict[str, Any]) -> str:
+    """Serializa una entrada del log como línea JSONL"""
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+
+def _parse_jsonl(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Parsea el contenido JSONL del log
+
+    Si alguna línea está corrupta (p. ej. escritura interrumpida) se
+    descartan solo esas líneas en lugar de todo el historial.
+    """
+    lines = data.split(b"\n")
+    try:
+        return [json.loads(line) for line in lines if line.strip()]
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        operations = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(entry, dict):
+                operations.append(entry)
+        return operations
+
+
+def _parse_legacy_log(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Parsea el log único de versiones anteriores
+
+    Puede ser el documento {"operations": [...]} indentado (con saltos de
+    línea \n o \r\n según el sistema que lo escribió) o un JSONL; el formato
+    se decide parseando, no por cómo empieza el fichero.
+    """
+    try:
+        document = json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return _parse_jsonl(data)
+    if isinstance(document, dict) and "operations" in document:
+        operations = document["operations"]
+        if not isinstance(operations, list):
+            return []
+        return [op for op in operations if isinstance(op, dict)]
+    # Un JSONL de una sola línea también es un documento JSON válido
+    return _parse_jsonl(data)
+
+
+def _read_shard(path: str) -> List[Dict[str, Any]]:
+    """Lee de una vez y parsea un fichero diario del log"""
+    with open(path, "rb") as f:
+        return _parse_jsonl(f.read())
+
+
+def _move_path(source: str, destination: str):
+    """
+    Mueve un archivo o carpeta priorizando un único rename(2)
+
+    os.replace resuelve el caso habitual (mismo sistema de archivos) sin los
+    stat adicionales de shutil.move. Entre unidades distintas se copia y se
+    elimina el origen; si el destino es una carpeta existente se conserva la
+    semántica de shutil.move (mover dentro de ella).
+    """
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno == errno.EXDEV and not os.path.isdir(source):
+            shutil.copy2(source, destination)
+            os.unlink(source)
+        elif e.errno == errno.EXDEV or os.path.isdir(destination):
+            shutil.move(source, destination)
+        else:
+            raise
+
+
 class TransactionManager:
     """
     Gestor de transacciones con capacidad de rollback automático
@@ -32,45 +139,294 @@ class TransactionManager:
     en caso de error o por petición del usuario.
     """
 
-    def __init__(self, log_file: str = "operations_log.json"):
+    # Entradas recientes que se mantienen en memoria; el resto queda en disco
+    MAX_OPERATIONS_IN_MEMORY = 10_000
+
+    def __init__(
+        self,
+        log_file: str = "operations_log.json",
+        max_operations_in_memory: int = MAX_OPERATIONS_IN_MEMORY,
+    ):
         """
         Inicializa el gestor de transacciones
 
         Args:
-            log_file: Archivo donde se registran las operaciones
+            log_file: Archivo base del log; las operaciones se guardan en
+                ficheros diarios <nombre>.YYYYMMDD.jsonl junto a él
+            max_operations_in_memory: Entradas recientes retenidas en memoria
         """
         self.log_file = Path(log_file)
         self.current_transaction: Optional[str] = None
-        self.operations: List[Dict[str, Any]] = []
+        self.operations: Deque[Dict[str, Any]] = deque(
+            maxlen=max_operations_in_memory
+        )
         self.is_transaction_active = False
-        self.last_error: Optional[str] = None
+        # Estado por hilo: safe_move_file se llama desde varios hilos a la vez
+        # y cada uno debe leer el error de su propia operación (last_error)
+        self._thread_state = threading.local()
+        # Contadores por tipo de entrada, mantenidos al registrar operaciones
+        self._counts: Dict[str, int] = dict.fromkeys(_COUNTED_TYPES, 0)
+        # Entradas registradas en total, incluidas las que ya no están en memoria
+        self._total = 0
+        # Posiciones absolutas (0.._total-1) de las operaciones de cada transacción
+        self._by_txn: Dict[str, List[int]] = {}
+        # Posición absoluta del marcador de inicio de cada transacción en memoria
+        self._txn_begin: Dict[str, int] = {}
+        # Primera posición en memoria cuando se reconstruyeron los índices; las
+        # posiciones desalojadas se podan al reconstruirlos de nuevo
+        self._index_floor = 0
+        # Espacio libre por directorio destino, válido durante la transacción
+        self._free_space: Dict[str, int] = {}
+        # safe_move_file puede llamarse desde varios hilos a la vez: este lock
+        # serializa el registro de operaciones y la reserva de espacio libre
+        self._lock = threading.Lock()
+        # Entradas pendientes de escribir; dentro de una transacción se
+        # vuelcan juntas al confirmarla o revertirla
+        self._pending: List[Dict[str, Any]] = []
+        # Marcador de inicio de la transacción activa aún sin operaciones
+        self._txn_marker: Optional[Dict[str, Any]] = None
+        # Reversión de cada tipo de operación (create_dir no requiere acción)
+        self._rollback_handlers = {
+            _TYPE_MOVE: self._revert_move,
+            _TYPE_RENAME: self._revert_rename,
+            _TYPE_DELETE: self._revert_delete,
+        }
+        # send2trash es opcional: se resuelve una vez y no en cada borrado
+        try:
+            import send2trash
+
+            self._send2trash = send2trash.send2trash
+        except ImportError:
+            self._send2trash = None
         self._load_log()
 
+    @property
+    def last_error(self) -> Optional[str]:
+        """Motivo del último fallo de una operación hecha desde este hilo"""
+        return getattr(self._thread_state, "last_error", None)
+
+    @last_error.setter
+    def last_error(self, value: Optional[str]):
+        self._thread_state.last_error = value
+
+    def _shard_path(self, day: date) -> Path:
+        """Ruta del fichero JSONL con las operaciones de un día"""
+        return self.log_file.with_name(f"{self.log_file.stem}.{day:%Y%m%d}.jsonl")
+
+    def _list_shards(self) -> List[Tuple[str, str]]:
+        """
+        Lista los ficheros diarios del log ordenados por fecha
+
+        Returns:
+            Lista de tuplas (YYYYMMDD, ruta)
+        """
+        prefix = f"{self.log_file.stem}."
+        shards = []
+        try:
+            with os.scandir(self.log_file.parent) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith(".jsonl")):
+                        continue
+                    day = name[len(prefix) : -len(".jsonl")]
+                    if len(day) == 8 and day.isdigit():
+                        shards.append((day, entry.path))
+        except OSError:
+            return []
+        shards.sort()
+        return shards
+
     def _load_log(self):
-        """Carga el log de operaciones previas"""
+        """
+        Carga el log de operaciones previas
+
+        El log se reparte en ficheros JSONL diarios (una operación por
+        línea); cada uno se lee de una vez y se parsea línea a línea sin
+        construir un documento completo. El fichero único de versiones
+        anteriores se migra a los ficheros diarios al cargarlo.
+        """
+        self._migrate_legacy_log()
+
+        # Los contadores cubren todo el historial; en memoria solo quedan las
+        # entradas más recientes
+        counts = dict.fromkeys(_COUNTED_TYPES, 0)
+        operations: Deque[Dict[str, Any]] = deque(maxlen=self.operations.maxlen)
+        total = 0
+        for _, shard in self._list_shards():
+            try:
+                entries = _read_shard(shard)
+            except IOError:
+                continue
+            for op in entries:
+                op_type = op.get("type")
+                if op_type in counts:
+                    counts[op_type] += 1
+            operations.extend(entries)
+            total += len(entries)
+
+        self.operations = operations
+        self._total = total
+        self._counts = counts
+        self._index_operations()
+
+    def _migrate_legacy_log(self):
+        """Reparte el log único antiguo (JSON o JSONL) en ficheros diarios"""
+        try:
+            data = self.log_file.read_bytes()
+        except IOError:
+            return
+
+        legacy = _parse_legacy_log(data)
+        if not legacy:
+            # Nada migrado: el fichero se conserva por si no era un log válido
+            return
+
+        for op in legacy:
+            if "ts" not in op:
+                op["ts"] = _iso_to_epoch(op.get("timestamp"))
+
+        # Si una migración anterior escribió las entradas pero no pudo borrar
+        # el fichero, no se vuelven a añadir (se duplicarían en cada inicio)
+        if not self._is_migrated(legacy[-1]) and not self._append_log(legacy):
+            return
+
         try:
-            if self.log_file.exists():
-                with open(self.log_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.operations = data.get("operations", [])
-        except (json.JSONDecodeError, IOError):
-            self.operations = []
-
-    def _save_log(self):
-        """Guarda el log de operaciones"""
+            self.log_file.unlink()
+        except OSError as e:
+            warn(f"Error migrando log: {e}")
+
+    def _is_migrated(self, entry: Dict[str, Any]) -> bool:
+        """Indica si la entrada ya está en el fichero diario que le corresponde"""
         try:
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "operations": self.operations,
-                        "last_save": datetime.now().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                )
-        except IOError as e:
-            print(f"⚠️ Error guardando log: {e}")
+            return entry in _read_shard(self._shard_path(date.fromtimestamp(entry["ts"])))
+        except (OSError, ValueError, OverflowError):
+            return False
+
+    def _index_operations(self):
+        """Reconstruye los índices por transacción de las entradas en memoria"""
+        by_txn: Dict[str, List[int]] = {}
+        txn_begin: Dict[str, int] = {}
+        for position, op in enumerate(self.operations, self._first_position()):
+            op_type = op.get("type")
+            if op_type in _OPERATION_TYPES:
+                by_txn.setdefault(op.get("transaction_id"), []).append(position)
+            elif op_type == _TXN_BEGIN:
+                txn_begin[op.get("transaction_id")] = position
+        self._by_txn = by_txn
+        self._txn_begin = txn_begin
+        self._index_floor = self._first_position()
+
+    def _first_position(self) -> int:
+        """Posición absoluta de la entrada más antigua que sigue en memoria"""
+        return self._total - len(self.operations)
+
+    def _record(self, entry: Dict[str, Any]):
+        """Añade una entrada al log en memoria y la deja pendiente de escribir"""
+        self.operations.append(entry)
+        self._total += 1
+        self._count(entry["type"])
+        self._pending.append(entry)
+        if len(self._pending) >= self.operations.maxlen:
+            # Lo que sale de memoria tiene que estar ya escrito en disco
+            self._flush_pending()
+        if self._first_position() - self._index_floor >= self.operations.maxlen:
+            # Cada maxlen desalojos se reconstruyen los índices con lo que
+            # sigue en memoria: su tamaño queda acotado y el coste, amortizado
+            self._index_operations()
+
+    def _operations_for(self, transaction_id: str) -> List[Dict[str, Any]]:
+        """
+        Obtiene las operaciones de una transacción
+
+        Si la transacción empezó antes de la entrada más antigua retenida en
+        memoria, se leen sus operaciones desde los ficheros diarios.
+        """
+        first = self._first_position()
+        begin = self._txn_begin.get(transaction_id)
+        if first == 0 or (begin is not None and begin >= first):
+            return [
+                self.operations[position - first]
+                for position in self._by_txn.get(transaction_id, ())
+            ]
+        return self._load_transaction_from_disk(transaction_id)
+
+    def _load_transaction_from_disk(self, transaction_id: str) -> List[Dict[str, Any]]:
+        """Lee desde disco las operaciones de una transacción ya desalojada"""
+        # Todo lo pendiente debe estar en disco antes de leer
+        self._flush_pending()
+
+        # El ID incluye la fecha de inicio (txn_YYYYMMDD_...)
+        txn_day = transaction_id[4:12]
+        if not txn_day.isdigit():
+            txn_day = ""
+
+        operations: List[Dict[str, Any]] = []
+        for day, shard in self._list_shards():
+            if day < txn_day:
+                continue
+            try:
+                entries = _read_shard(shard)
+            except IOError:
+                continue
+            found = [
+                op
+                for op in entries
+                if op.get("transaction_id") == transaction_id
+                and op.get("type") in _OPERATION_TYPES
+            ]
+            if not found and operations:
+                break
+            operations.extend(found)
+        return operations
+
+    def _count(self, op_type: str):
+        """Incrementa el contador del tipo de entrada indicado"""
+        if op_type in self._counts:
+            self._counts[op_type] += 1
+
+    def _append_log(self, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Añade entradas al fichero diario que corresponde a cada una
+
+        Returns:
+            True si se escribieron todas las entradas
+        """
+        by_day: Dict[date, List[str]] = {}
+        for op in entries:
+            day = date.fromtimestamp(op["ts"])
+            by_day.setdefault(day, []).append(_to_jsonl(op))
+
+        written = True
+        for day, lines in by_day.items():
+            try:
+                with open(self._shard_path(day), "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            except IOError as e:
+                warn(f"Error guardando log: {e}")
+                written = False
+        return written
+
+    def _flush_pending(self):
+        """Escribe en disco las entradas pendientes de una sola vez"""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._append_log(pending)
+
+    def _get_free_space(self, dest_dir: str) -> int:
+        """
+        Obtiene el espacio libre del directorio destino
+
+        Dentro de una transacción se consulta una sola vez por directorio y
+        se descuenta localmente lo movido en lugar de repetir disk_usage.
+        """
+        if not self.is_transaction_active:
+            return shutil.disk_usage(dest_dir).free
+
+        free_space = self._free_space.get(dest_dir)
+        if free_space is None:
+            free_space = shutil.disk_usage(dest_dir).free
+            self._free_space[dest_dir] = free_space
+        return free_space
 
     def begin_transaction(self, description: str = "") -> str:
         """
@@ -82,22 +438,22 @@ class TransactionManager:
         Returns:
             ID de la transacción
         """
-        transaction_id = f"txn_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        now = datetime.now()
+        transaction_id = f"txn_{now:%Y%m%d_%H%M%S_%f}"
         self.current_transaction = transaction_id
         self.is_transaction_active = True
-
-        # Agregar marcador de inicio de transacción
-        self.operations.append(
-            {
-                "type": "transaction_begin",
-                "transaction_id": transaction_id,
-                "description": description,
-                "timestamp": datetime.now().isoformat(),
-                "operations_count": 0,
-            }
-        )
-
-        self._save_log()
+        self._free_space.clear()
+
+        # El marcador de inicio se registra junto con la primera operación,
+        # así una transacción vacía no deja rastro en el log
+        self._txn_marker = {
+            "type": _TXN_BEGIN,
+            "transaction_id": transaction_id,
+            "description": description,
+            "timestamp": now.isoformat(),
+            "ts": now.timestamp(),
+            "operations_count": 0,
+        }
         return transaction_id
 
     def commit_transaction(self) -> bool:
@@ -110,18 +466,24 @@ class TransactionManager:
         if not self.is_transaction_active:
             return False
 
-        # Agregar marcador de fin de transacción
-        self.operations.append(
-            {
-                "type": "transaction_commit",
+        if self._txn_marker is not None:
+            # Transacción sin operaciones: se descarta sin escribir nada
+            self._txn_marker = None
+        else:
+            # Agregar marcador de fin de transacción
+            now = datetime.now()
+            marker = {
+                "type": _TXN_COMMIT,
                 "transaction_id": self.current_transaction,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
+                "ts": now.timestamp(),
             }
-        )
+            self._record(marker)
 
         self.is_transaction_active = False
         self.current_transaction = None
-        self._save_log()
+        self._free_space.clear()
+        self._flush_pending()
         return True
 
     def safe_move_file(self, source: Path, destination: Path) -> bool:
@@ -135,39 +497,50 @@ class TransactionManager:
         Returns:
             True si se movió exitosamente
         """
+        src = os.fspath(source)
         try:
             self.last_error = None
-            # Validaciones previas
-            if not source.exists():
-                raise FileNotFoundError(f"Archivo origen no existe: {source}")
-
-            if not os.access(source, os.R_OK):
-                raise PermissionError(f"Sin permisos de lectura: {source}")
-
-            dest_dir = destination.parent
-            if not dest_dir.exists():
-                dest_dir.mkdir(parents=True, exist_ok=True)
+            dst = os.fspath(destination)
+            # Un único stat cubre la existencia del origen y su tamaño
+            try:
+                required_space = os.stat(src, follow_symlinks=False).st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Archivo origen no existe: {src}") from None
+
+            dest_dir = os.path.dirname(dst) or "."
+            try:
+                os.makedirs(dest_dir)
+            except FileExistsError:
+                pass
+            else:
                 # Registrar creación de directorio
-                self._log_operation(OperationType.CREATE_DIR, {"path": str(dest_dir)})
+                self._log_operation(OperationType.CREATE_DIR, {"path": dest_dir})
 
-            if not os.access(dest_dir, os.W_OK):
-                raise PermissionError(f"Sin permisos de escritura: {dest_dir}")
-
-            # Verificar espacio disponible
-            required_space = source.stat().st_size
-            free_space = shutil.disk_usage(dest_dir).free
-            if required_space > free_space:
-                raise IOError(f"Espacio insuficiente: {required_space} > {free_space}")
+            # Verificar y reservar espacio disponible (los permisos los valida
+            # el propio move)
+            with self._lock:
+                free_space = self._get_free_space(dest_dir)
+                if required_space > free_space:
+                    raise IOError(f"Espacio insuficiente: {required_space} > {free_space}")
+                if self.is_transaction_active:
+                    self._free_space[dest_dir] = free_space - required_space
 
             # Mover archivo
-            shutil.move(str(source), str(destination))
+            try:
+                _move_path(src, dst)
+            except Exception:
+                if self.is_transaction_active:
+                    with self._lock:
+                        if dest_dir in self._free_space:
+                            self._free_space[dest_dir] += required_space
+                raise
 
             # Registrar operación
             self._log_operation(
                 OperationType.MOVE,
                 {
-                    "source": str(source),
-                    "destination": str(destination),
+                    "source": src,
+                    "destination": dst,
                     "size": required_space,
                 },
             )
@@ -176,9 +549,29 @@ class TransactionManager:
 
         except Exception as e:
             self.last_error = str(e)
-            error(f"Error moviendo {source}: {e}")
+            error(f"Error moviendo {src}: {e}")
             return False
 
+    @staticmethod
+    def _move_to_quarantine(path: str) -> str:
+        """
+        Mueve un archivo a la carpeta .quarantine junto a él
+
+        Returns:
+            Ruta final dentro de la cuarentena
+        """
+        parent, name = os.path.split(path)
+        quarantine_dir = os.path.join(parent, ".quarantine")
+        os.makedirs(quarantine_dir, exist_ok=True)
+        destination = os.path.join(quarantine_dir, name)
+        stem, suffix = os.path.splitext(name)
+        counter = 1
+        while os.path.exists(destination):
+            destination = os.path.join(quarantine_dir, f"{stem}_{counter}{suffix}")
+            counter += 1
+        _move_path(path, destination)
+        return destination
+
     def safe_delete_file(self, file_path: Path, use_trash: bool = True) -> bool:
         """
         Elimina un archivo de forma segura
@@ -190,55 +583,34 @@ class TransactionManager:
         Returns:
             True si se eliminó exitosamente
         """
+        path = os.fspath(file_path)
         try:
             self.last_error = None
-            if not file_path.exists():
-                raise FileNotFoundError(f"Archivo no existe: {file_path}")
-
-            file_size = file_path.stat().st_size
-
-            if use_trash:
-                # Intentar mover a papelera
-                try:
-                    import send2trash
-
-                    send2trash.send2trash(str(file_path))
-                    operation_type = "delete_to_trash"
-                except ImportError:
-                    # Si send2trash no está disponible, usar cuarentena en lugar de borrado directo
-                    quarantine_dir = file_path.parent / ".quarantine"
-                    quarantine_dir.mkdir(parents=True, exist_ok=True)
-                    destination = quarantine_dir / file_path.name
-                    counter = 1
-                    while destination.exists():
-                        destination = (
-                            quarantine_dir
-                            / f"{file_path.stem}_{counter}{file_path.suffix}"
-                        )
-                        counter += 1
-                    shutil.move(str(file_path), str(destination))
-                    operation_type = "delete_to_quarantine"
-                    warn(
-                        f"send2trash no disponible; archivo enviado a cuarentena: {destination}"
-                    )
+            try:
+                file_size = os.stat(path).st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Archivo no existe: {path}") from None
+
+            if use_trash and self._send2trash is not None:
+                # Mover a papelera
+                self._send2trash(path)
+                operation_type = "delete_to_trash"
+            elif use_trash:
+                # Si send2trash no está disponible, usar cuarentena en lugar de borrado directo
+                destination = self._move_to_quarantine(path)
+                operation_type = "delete_to_quarantine"
+                warn(
+                    f"send2trash no disponible; archivo enviado a cuarentena: {destination}"
+                )
             else:
-                quarantine_dir = file_path.parent / ".quarantine"
-                quarantine_dir.mkdir(parents=True, exist_ok=True)
-                destination = quarantine_dir / file_path.name
-                counter = 1
-                while destination.exists():
-                    destination = (
-                        quarantine_dir / f"{file_path.stem}_{counter}{file_path.suffix}"
-                    )
-                    counter += 1
-                shutil.move(str(file_path), str(destination))
+                self._move_to_quarantine(path)
                 operation_type = "delete_to_quarantine"
 
             # Registrar operación
             self._log_operation(
                 OperationType.DELETE,
                 {
-                    "path": str(file_path),
+                    "path": path,
                     "size": file_size,
                     "operation_type": operation_type,
                 },
@@ -248,7 +620,7 @@ class TransactionManager:
 
         except Exception as e:
             self.last_error = str(e)
-            error(f"Error eliminando {file_path}: {e}")
+            error(f"Error eliminando {path}: {e}")
             return False
 
     def safe_rename_file(self, old_path: Path, new_name: str) -> bool:
@@ -262,25 +634,27 @@ class TransactionManager:
         Returns:
             True si se renombró exitosamente
         """
+        old = os.fspath(old_path)
         try:
             self.last_error = None
-            if not old_path.exists():
-                raise FileNotFoundError(f"Archivo no existe: {old_path}")
+            if not os.path.exists(old):
+                raise FileNotFoundError(f"Archivo no existe: {old}")
 
-            new_path = old_path.parent / new_name
+            parent, old_name = os.path.split(old)
+            new = os.path.join(parent, new_name)
 
-            if new_path.exists():
-                raise FileExistsError(f"Ya existe: {new_path}")
+            if os.path.exists(new):
+                raise FileExistsError(f"Ya existe: {new}")
 
-            old_path.rename(new_path)
+            os.rename(old, new)
 
             # Registrar operación
             self._log_operation(
                 OperationType.RENAME,
                 {
-                    "old_path": str(old_path),
-                    "new_path": str(new_path),
-                    "old_name": old_path.name,
+                    "old_path": old,
+                    "new_path": new,
+                    "old_name": old_name,
                     "new_name": new_name,
                 },
             )
@@ -289,7 +663,7 @@ class TransactionManager:
 
         except Exception as e:
             self.last_error = str(e)
-            error(f"Error renombrando {old_path}: {e}")
+            error(f"Error renombrando {old}: {e}")
             return False
 
     def _log_operation(self, operation_type: OperationType, details: Dict[str, Any]):
@@ -300,15 +674,52 @@ class TransactionManager:
             operation_type: Tipo de operación
             details: Detalles específicos de la operación
         """
-        operation = {
-            "type": operation_type.value,
-            "transaction_id": self.current_transaction,
-            "timestamp": datetime.now().isoformat(),
-            "details": details,
-        }
+        with self._lock:
+            if self._txn_marker is not None:
+                self._txn_begin[self.current_transaction] = self._total
+                self._record(self._txn_marker)
+                self._txn_marker = None
+
+            now = datetime.now()
+            operation = {
+                "type": operation_type.value,
+                "transaction_id": self.current_transaction,
+                "timestamp": now.isoformat(),
+                "ts": now.timestamp(),
+                "details": details,
+            }
+
+            self._by_txn.setdefault(self.current_transaction, []).append(self._total)
+            self._record(operation)
+            if not self.is_transaction_active:
+                self._flush_pending()
+
+    # Los _revert_* devuelven None si revierten la operación o el motivo
+    # por el que no se pudo, que rollback_transaction agrupa en un solo aviso
+
+    def _revert_move(self, details: Dict[str, Any]) -> Optional[str]:
+        """Devuelve un archivo movido a su ubicación original"""
+        source = details["source"]
+        destination = details["destination"]
+
+        if os.path.exists(destination):
+            _move_path(destination, source)
+            return None
+        return f"No se puede revertir: {destination} no existe"
+
+    def _revert_rename(self, details: Dict[str, Any]) -> Optional[str]:
+        """Restaura el nombre original de un archivo renombrado"""
+        old_path = details["old_path"]
+        new_path = details["new_path"]
+
+        if os.path.exists(new_path):
+            os.rename(new_path, old_path)
+            return None
+        return f"No se puede revertir: {new_path} no existe"
 
-        self.operations.append(operation)
-        self._save_log()
+    def _revert_delete(self, details: Dict[str, Any]) -> Optional[str]:
+        """Los archivos eliminados no se pueden recuperar desde aquí"""
+        return f"No se puede recuperar archivo eliminado: {details['path']}"
 
     def rollback_transaction(self, transaction_id: Optional[str] = None) -> bool:
         """
@@ -329,12 +740,7 @@ class TransactionManager:
                 return False
 
             # Encontrar operaciones de la transacción
-            transaction_ops = [
-                op
-                for op in self.operations
-                if op.get("transaction_id") == transaction_id
-                and op.get("type") != "transaction_begin"
-            ]
+            transaction_ops = self._operations_for(transaction_id)
 
             if not transaction_ops:
                 warn(
@@ -344,57 +750,40 @@ class TransactionManager:
 
             # Revertir en orden inverso
             success_count = 0
-            error_count = 0
+            issues: List[str] = []
 
+            handlers = self._rollback_handlers
             for op in reversed(transaction_ops):
+                handler = handlers.get(op["type"])
+                if handler is None:
+                    continue
                 try:
-                    if op["type"] == OperationType.MOVE.value:
-                        # Revertir movimiento
-                        source = Path(op["details"]["source"])
-                        destination = Path(op["details"]["destination"])
-
-                        if destination.exists():
-                            shutil.move(str(destination), str(source))
-                            success_count += 1
-                        else:
-                            warn(f"No se puede revertir: {destination} no existe")
-                            error_count += 1
-
-                    elif op["type"] == OperationType.RENAME.value:
-                        # Revertir renombre
-                        old_path = Path(op["details"]["old_path"])
-                        new_path = Path(op["details"]["new_path"])
-
-                        if new_path.exists():
-                            new_path.rename(old_path)
-                            success_count += 1
-                        else:
-                            warn(f"No se puede revertir: {new_path} no existe")
-                            error_count += 1
-
-                    elif op["type"] == OperationType.DELETE.value:
-                        # No se puede recuperar archivos eliminados permanentemente
-                        warn(
-                            f"No se puede recuperar archivo eliminado: {op['details']['path']}"
-                        )
-                        error_count += 1
-
+                    issue = handler(op["details"])
                 except Exception as e:
-                    error(f"Error revirtiendo operación: {e}")
-                    error_count += 1
+                    issue = f"Error revirtiendo operación: {e}"
+                if issue is None:
+                    success_count += 1
+                else:
+                    issues.append(issue)
 
-            # Registrar resultado del rollback
-            self.operations.append(
-                {
-                    "type": "transaction_rollback",
-                    "transaction_id": transaction_id,
-                    "timestamp": datetime.now().isoformat(),
-                    "reverted_operations": success_count,
-                    "errors": error_count,
-                }
-            )
+            # Un único aviso con todas las incidencias en lugar de uno por archivo
+            error_count = len(issues)
+            if issues:
+                warn("Incidencias durante el rollback:\n  " + "\n  ".join(issues))
 
-            self._save_log()
+            # Registrar resultado del rollback
+            now = datetime.now()
+            marker = {
+                "type": _TXN_ROLLBACK,
+                "transaction_id": transaction_id,
+                "timestamp": now.isoformat(),
+                "ts": now.timestamp(),
+                "reverted_operations": success_count,
+                "errors": error_count,
+            }
+            self._record(marker)
+            self._free_space.clear()
+            self._flush_pending()
 
             success(
                 f"Rollback completado: {success_count} operaciones revertidas, {error_count} errores"
@@ -416,28 +805,29 @@ class TransactionManager:
             Lista de transacciones
         """
         transactions = []
-        current_txn = None
-
-        for op in reversed(self.operations):
-            if op.get("type") == "transaction_begin":
-                if current_txn:
-                    transactions.append(current_txn)
-                    if len(transactions) >= limit:
-                        break
-
-                current_txn = {
-                    "id": op["transaction_id"],
-                    "description": op.get("description", ""),
-                    "timestamp": op["timestamp"],
-                    "operations": [],
+        first = self._first_position()
+
+        # Marcadores de inicio de la más reciente a la más antigua
+        for transaction_id in reversed(self._txn_begin):
+            if len(transactions) >= limit:
+                break
+            begin_position = self._txn_begin[transaction_id]
+            if begin_position < first:
+                # El resto de transacciones ya no están en memoria
+                break
+
+            begin = self.operations[begin_position - first]
+            transactions.append(
+                {
+                    "id": transaction_id,
+                    "description": begin.get("description", ""),
+                    "timestamp": begin["timestamp"],
+                    "operations": [
+                        self.operations[position - first]
+                        for position in self._by_txn.get(transaction_id, ())
+                    ],
                 }
-
-            elif current_txn and op.get("transaction_id") == current_txn["id"]:
-                if op.get("type") not in ["transaction_begin", "transaction_commit"]:
-                    current_txn["operations"].append(op)
-
-        if current_txn:
-            transactions.append(current_txn)
+            )
 
         return transactions
 
@@ -448,50 +838,18 @@ class TransactionManager:
         Returns:
             Diccionario con estadísticas
         """
-        total_ops = len(
-            [
-                op
-                for op in self.operations
-                if op.get("type")
-                in [
-                    OperationType.MOVE.value,
-                    OperationType.DELETE.value,
-                    OperationType.RENAME.value,
-                ]
-            ]
-        )
-
-        move_ops = len(
-            [op for op in self.operations if op.get("type") == OperationType.MOVE.value]
-        )
-        delete_ops = len(
-            [
-                op
-                for op in self.operations
-                if op.get("type") == OperationType.DELETE.value
-            ]
-        )
-        rename_ops = len(
-            [
-                op
-                for op in self.operations
-                if op.get("type") == OperationType.RENAME.value
-            ]
-        )
-
-        rollbacks = len(
-            [op for op in self.operations if op.get("type") == "transaction_rollback"]
-        )
+        counts = self._counts
+        move_ops = counts[_TYPE_MOVE]
+        delete_ops = counts[_TYPE_DELETE]
+        rename_ops = counts[_TYPE_RENAME]
 
         return {
-            "total_operations": total_ops,
+            "total_operations": move_ops + delete_ops + rename_ops,
             "move_operations": move_ops,
             "delete_operations": delete_ops,
             "rename_operations": rename_ops,
-            "rollbacks_performed": rollbacks,
-            "transactions_count": len(
-                [op for op in self.operations if op.get("type") == "transaction_begin"]
-            ),
+            "rollbacks_performed": counts[_TXN_ROLLBACK],
+            "transactions_count": counts[_TXN_BEGIN],
         }
 
     def clear_old_logs(self, days_old: int = 30):
@@ -501,17 +859,33 @@ class TransactionManager:
         Args:
             days_old: Días de antigüedad para limpiar
         """
-        from datetime import datetime, timedelta
-
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-
-        self.operations = [
-            op
-            for op in self.operations
-            if datetime.fromisoformat(op["timestamp"]) > cutoff_date
-        ]
-
-        self._save_log()
+        self._flush_pending()
+        cutoff = time.time() - days_old * 86400
+        cutoff_day = f"{date.fromtimestamp(cutoff):%Y%m%d}"
+
+        for day, shard in self._list_shards():
+            if day > cutoff_day:
+                break
+            try:
+                if day < cutoff_day:
+                    # Días completos anteriores al corte: se eliminan sin parsear
+                    os.unlink(shard)
+                    continue
+                # El día del corte se filtra entrada a entrada: varios gestores
+                # pueden escribir en el mismo fichero y sus transacciones se
+                # vuelcan al confirmarse, así que no está ordenado por ts
+                entries = _read_shard(shard)
+                kept = [op for op in entries if op.get("ts", 0.0) > cutoff]
+                if not kept:
+                    os.unlink(shard)
+                elif len(kept) < len(entries):
+                    with open(shard, "w", encoding="utf-8") as f:
+                        f.write("".join(_to_jsonl(op) for op in kept))
+            except OSError as e:
+                warn(f"No se pudo limpiar {shard}: {e}")
+
+        # Contadores e índices se recalculan desde lo que queda en disco
+        self._load_log()
         success(f"Logs antiguos limpiados (>{days_old} días)")
 
     def print_statistics(self):
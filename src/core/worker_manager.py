@@ -4,12 +4,18 @@ Gestor Centralizado de Workers para el Organizador de Archivos
 Controla la ejecución, cancelación y limpieza de workers
 """
 
+import os
 import threading
 import time
-from typing import Dict, Any, Optional, List, Type
+import weakref
+from collections import Counter, deque
+from typing import Deque, Dict, Any, Mapping, Optional, List, Protocol, Tuple, Type
 from dataclasses import dataclass
-from enum import Enum
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from enum import IntEnum
+from types import MappingProxyType
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+from src.utils.logger import debug, error
 
 # ⚠️ CRÍTICO: Importaciones lazy para evitar ejecución prematura en PyInstaller
 # NO importar directamente - usar funciones getter para acceso lazy
@@ -29,26 +35,96 @@ def _get_memory_manager():
     return memory_manager
 
 
-class WorkerStatus(Enum):
-    """Estados de un worker"""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-    ERROR = "error"
+# Señales opcionales de los workers, como bits de una máscara por clase.
+# Los slots se declaran con @pyqtSlot y tipos canónicos (str, bool), de modo
+# que Qt resuelve la conexión por firma normalizada.
+OPT_PROGRESS = 1 << 0
+OPT_ERROR = 1 << 1
+OPT_ANALYSIS_COMPLETE = 1 << 2
+OPT_ORGANIZE_COMPLETE = 1 << 3
+
+_OPTIONAL_SIGNAL_FLAGS = (
+    ("progress_update", OPT_PROGRESS),
+    ("error_occurred", OPT_ERROR),
+    ("analysis_complete", OPT_ANALYSIS_COMPLETE),
+    ("organize_complete", OPT_ORGANIZE_COMPLETE),
+)
+
+
+class WorkerProtocol(Protocol):
+    """
+    Interfaz que WorkerManager espera de un worker (un QThread)
+
+    Señales opcionales, detectadas una vez por clase en register_worker_class:
+        progress_update   = pyqtSignal(str)      (o (int, int); el slot no usa args)
+        error_occurred    = pyqtSignal(str)
+        analysis_complete = pyqtSignal(list, list, dict)  (el slot no usa args)
+        organize_complete = pyqtSignal(bool, str)
+
+    duplicates_found no se monitoriza: son lotes de resultados para la UI, no
+    progreso, y convertirlos en ticks costaba un lock y una emisión por lote.
+    """
+    finished: pyqtSignal
+
+    def start(self) -> None: ...
+
+
+# Intervalo mínimo (s) y avance mínimo entre emisiones de worker_progress
+PROGRESS_EMIT_INTERVAL = 0.016
+PROGRESS_EMIT_DELTA = 0.01
+
+# Trazas del ciclo de vida de cada worker (inicio, fin, cancelación). Apagadas
+# por defecto: el mensaje ni siquiera se formatea si no se van a mostrar. Se
+# activan sin tocar el código con ORDENASION_DEBUG_WORKERS=1 (o true/yes/on)
+LOG_WORKER_LIFECYCLE = os.environ.get("ORDENASION_DEBUG_WORKERS", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+# Espera máxima (ms) a la parada cooperativa antes de forzar terminate()
+CANCEL_WAIT_MS = 500
+
+
+class WorkerStatus(IntEnum):
+    """Estados de un worker (enteros: comparaciones y hash baratos)"""
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    CANCELLED = 3
+    ERROR = 4
+
+    @property
+    def label(self) -> str:
+        """Nombre legible del estado ("pending", "running", ...)"""
+        return self.name.lower()
 
+    def __str__(self) -> str:
+        return self.label
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkerInfo:
-    """Información de un worker"""
+    """Información de un worker (con __slots__: sin __dict__ por instancia)"""
     worker_id: str
     worker_type: str
-    worker: QThread
+    worker: Optional[QThread]  # Referencia fuerte solo mientras está activo
     status: WorkerStatus
-    started_at: float
-    completed_at: Optional[float] = None
+    started_at_ns: int  # time.monotonic_ns()
+    completed_at_ns: Optional[int] = None
     error_message: Optional[str] = None
     progress: float = 0.0
+    last_emitted_progress: float = -1.0
+    last_emit_ts: float = 0.0
+    worker_ref: Optional[weakref.ref] = None  # Solo diagnóstico, en historial
+
+    @property
+    def duration_s(self) -> Optional[float]:
+        """Duración en segundos (None si el worker no ha terminado)"""
+        if self.completed_at_ns is None:
+            return None
+        return (self.completed_at_ns - self.started_at_ns) / 1e9
 
 
 class WorkerManager(QObject):
@@ -69,14 +145,27 @@ class WorkerManager(QObject):
         # === CONFIGURACIÓN ===
         self.max_concurrent_workers = 2  # Máximo 2 workers simultáneos
         self.worker_timeout = 300  # Timeout de 5 minutos
+        self.max_history = 100  # Entradas conservadas en el historial
         
         # === REGISTROS ===
         self.active_workers: Dict[str, WorkerInfo] = {}
+        # Vista de solo lectura (no copia); active_workers nunca se reasigna
+        self._active_view: Mapping[str, WorkerInfo] = MappingProxyType(self.active_workers)
         self.worker_queue: List[WorkerInfo] = []
-        self.worker_history: List[WorkerInfo] = []
+        self.worker_history: Deque[WorkerInfo] = deque(maxlen=self.max_history)
+        # Workers en estado RUNNING por tipo, mantenido en cada cambio de estado
+        self._running_by_type: Counter = Counter()
+        # Worker emisor -> worker_id, para que los slots no necesiten closures
+        # Clave id(worker): entero, sin depender del hash de los wrappers de
+        # QThread; el id es estable porque WorkerInfo retiene el worker activo
+        self._id_by_thread: Dict[int, str] = {}
+        # Clase de worker -> máscara OPT_* de las señales opcionales que declara
+        self._class_signal_mask: Dict[type, int] = {}
         
         # === LOCKING ===
-        self.lock = threading.RLock()
+        # Lock no reentrante: ningún método llama a otro que tome el lock ni
+        # invoca managers externos (que notifican observadores) mientras lo tiene
+        self.lock = threading.Lock()
         
         # === CONFIGURACIÓN DE WORKERS ===
         self.worker_configs = {
@@ -101,10 +190,24 @@ class WorkerManager(QObject):
                 "timeout": 120
             }
         }
+        # Vistas planas por tipo: una sola consulta en el camino de arranque
+        self._max_concurrent_by_type: Dict[str, int] = {
+            worker_type: config.get("max_concurrent", 1)
+            for worker_type, config in self.worker_configs.items()
+        }
+        self._priority_by_type: Dict[str, int] = {
+            worker_type: config.get("priority", 0)
+            for worker_type, config in self.worker_configs.items()
+        }
+        self._timeout_by_type: Dict[str, int] = {
+            worker_type: config.get("timeout", self.worker_timeout)
+            for worker_type, config in self.worker_configs.items()
+        }
         
         # Conectar con ApplicationState (de forma lazy)
         self._state_observer_connected = False
     
+    @pyqtSlot(object)
     def _on_state_changed(self, event):
         """Maneja cambios del estado de la aplicación"""
         EventType = _get_event_type()  # Lazy import
@@ -126,7 +229,7 @@ class WorkerManager(QObject):
                 app_state.add_observer(self._on_state_changed)
                 self._state_observer_connected = True
             except Exception as e:
-                print(f"Error conectando observador de estado: {e}")
+                error(f"Error conectando observador de estado: {e}")
     
     def start_worker(self, worker_id: str, worker: QThread, worker_type: str) -> bool:
         """
@@ -146,12 +249,14 @@ class WorkerManager(QObject):
         with self.lock:
             # Verificar si ya existe un worker con este ID
             if worker_id in self.active_workers:
-                print(f"Worker {worker_id} ya está activo")
+                if LOG_WORKER_LIFECYCLE:
+                    debug(f"Worker {worker_id} ya está activo")
                 return False
             
             # Verificar límites de concurrencia
             if not self._can_start_worker(worker_type):
-                print(f"No se puede iniciar {worker_type}: límite de concurrencia alcanzado")
+                if LOG_WORKER_LIFECYCLE:
+                    debug(f"No se puede iniciar {worker_type}: límite de concurrencia alcanzado")
                 return False
             
             # Crear información del worker
@@ -160,11 +265,12 @@ class WorkerManager(QObject):
                 worker_type=worker_type,
                 worker=worker,
                 status=WorkerStatus.PENDING,
-                started_at=time.time()
+                started_at_ns=time.monotonic_ns()
             )
             
             # Registrar worker
             self.active_workers[worker_id] = worker_info
+            self._id_by_thread[id(worker)] = worker_id
             
             # Conectar señales del worker
             self._connect_worker_signals(worker, worker_id)
@@ -172,193 +278,321 @@ class WorkerManager(QObject):
             # Iniciar worker
             try:
                 worker.start()
-                worker_info.status = WorkerStatus.RUNNING
-                
-                # Registrar en ApplicationState (lazy import)
-                app_state = _get_app_state()
-                app_state.register_worker(worker_id, worker)
-                
-                # Registrar en MemoryManager (lazy import)
-                memory_manager = _get_memory_manager()
-                memory_manager.register_worker(worker_id, worker)
-                
-                # Emitir señales
-                self.worker_started.emit(worker_id, worker_type)
-                
-                print(f"Worker {worker_id} ({worker_type}) iniciado correctamente")
-                return True
-                
+                self._set_status(worker_info, WorkerStatus.RUNNING)
             except Exception as e:
-                # Error al iniciar
-                worker_info.status = WorkerStatus.ERROR
-                worker_info.error_message = str(e)
-                
-                # Limpiar registro
-                del self.active_workers[worker_id]
-                
+                self._discard_failed_start_locked(worker_info, e)
+                start_error = str(e)
+            else:
+                start_error = None
+        
+        # Las señales se emiten fuera del lock: los slots conectados en directo
+        # se ejecutan en este hilo y no deben alargar la sección crítica
+        if start_error is not None:
+            self.worker_error.emit(worker_id, start_error)
+            error(f"Error iniciando worker {worker_id}: {start_error}")
+            return False
+        
+        # Registrar en ApplicationState y MemoryManager fuera del lock: ambos
+        # notifican a observadores que pueden volver a llamar a este gestor
+        try:
+            _get_app_state().register_worker(worker_id, worker)
+            _get_memory_manager().register_worker(worker_id, worker)
+        except Exception as e:
+            with self.lock:
+                discarded = self.active_workers.get(worker_id) is worker_info
+                if discarded:
+                    self._discard_failed_start_locked(worker_info, e)
+            if discarded:
                 self.worker_error.emit(worker_id, str(e))
-                print(f"Error iniciando worker {worker_id}: {e}")
-                return False
+            error(f"Error iniciando worker {worker_id}: {e}")
+            return False
+        
+        self.worker_started.emit(worker_id, worker_type)
+        if LOG_WORKER_LIFECYCLE:
+            debug(f"Worker {worker_id} ({worker_type}) iniciado correctamente")
+        return True
+    
+    def _discard_failed_start_locked(self, worker_info: WorkerInfo, exc: Exception):
+        """Descarta un worker que no se pudo iniciar (requiere self.lock)"""
+        self._set_status(worker_info, WorkerStatus.ERROR)
+        worker_info.error_message = str(exc)
+        
+        # Limpiar registro
+        del self.active_workers[worker_info.worker_id]
+        self._id_by_thread.pop(id(worker_info.worker), None)
     
     def _can_start_worker(self, worker_type: str) -> bool:
         """Verifica si se puede iniciar un worker del tipo especificado"""
-        config = self.worker_configs.get(worker_type, {})
-        max_concurrent = config.get("max_concurrent", 1)
-        
-        # Contar workers activos del mismo tipo
-        same_type_count = sum(
-            1 for info in self.active_workers.values()
-            if info.worker_type == worker_type and info.status == WorkerStatus.RUNNING
-        )
-        
         # Verificar límite total de workers
         if len(self.active_workers) >= self.max_concurrent_workers:
             return False
         
         # Verificar límite específico del tipo
-        if same_type_count >= max_concurrent:
-            return False
-        
-        return True
+        max_concurrent = self._max_concurrent_by_type.get(worker_type, 1)
+        return self._running_by_type[worker_type] < max_concurrent
+    
+    def _set_status(self, worker_info: WorkerInfo, status: WorkerStatus):
+        """Cambia el estado de un worker manteniendo el contador por tipo"""
+        previous = worker_info.status
+        if previous == status:
+            return
+        worker_info.status = status
+        if status == WorkerStatus.RUNNING:
+            self._running_by_type[worker_info.worker_type] += 1
+        elif previous == WorkerStatus.RUNNING:
+            worker_type = worker_info.worker_type
+            self._running_by_type[worker_type] -= 1
+            if self._running_by_type[worker_type] <= 0:
+                del self._running_by_type[worker_type]
+    
+    def register_worker_class(self, cls: Type[WorkerProtocol]) -> int:
+        """
+        Registra una clase de worker calculando una sola vez qué señales
+        opcionales declara
+
+        Returns:
+            int: Máscara de bits OPT_* de la clase
+        """
+        mask = 0
+        for signal_name, flag in _OPTIONAL_SIGNAL_FLAGS:
+            if hasattr(cls, signal_name):
+                mask |= flag
+        self._class_signal_mask[cls] = mask
+        return mask
     
-    def _connect_worker_signals(self, worker: QThread, worker_id: str):
+    def _connect_worker_signals(self, worker: WorkerProtocol, worker_id: str):
         """Conecta las señales del worker para monitoreo"""
         try:
             # Señales comunes de QThread
-            worker.finished.connect(lambda: self._on_worker_finished(worker_id))
-            
-            # Señales específicas según el tipo de worker
-            if hasattr(worker, 'progress_update'):
-                worker.progress_update.connect(
-                    lambda msg: self._on_worker_progress(worker_id, msg)
-                )
-            
-            if hasattr(worker, 'error_occurred'):
-                worker.error_occurred.connect(
-                    lambda msg: self._on_worker_error(worker_id, msg)
-                )
+            worker.finished.connect(self._slot_finished)
             
-            if hasattr(worker, 'analysis_complete'):
-                worker.analysis_complete.connect(
-                    lambda *args: self._on_worker_completed(worker_id, True)
-                )
-            
-            if hasattr(worker, 'organize_complete'):
-                worker.organize_complete.connect(
-                    lambda success, msg: self._on_worker_completed(worker_id, success)
-                )
+            # Señales específicas según la clase del worker
+            mask = self._class_signal_mask.get(type(worker))
+            if mask is None:
+                mask = self.register_worker_class(type(worker))
             
-            if hasattr(worker, 'duplicates_found'):
-                worker.duplicates_found.connect(
-                    lambda *args: self._on_worker_progress(worker_id, "Duplicados encontrados")
-                )
+            if mask & OPT_PROGRESS:
+                worker.progress_update.connect(self._slot_progress)
+            if mask & OPT_ERROR:
+                worker.error_occurred.connect(self._slot_error)
+            if mask & OPT_ANALYSIS_COMPLETE:
+                worker.analysis_complete.connect(self._slot_analysis_complete)
+            if mask & OPT_ORGANIZE_COMPLETE:
+                worker.organize_complete.connect(self._slot_organize_complete)
             
         except Exception as e:
-            print(f"Error conectando señales del worker {worker_id}: {e}")
+            error(f"Error conectando señales del worker {worker_id}: {e}")
+    
+    # === SLOTS ===
+    # El worker_id se obtiene del emisor (self.sender()) en lugar de capturarlo
+    # en un lambda por conexión
+    
+    def _sender_worker_id(self) -> Optional[str]:
+        """Obtiene el worker_id del worker que emitió la señal actual"""
+        return self._id_by_thread.get(id(self.sender()))
+    
+    @pyqtSlot()
+    def _slot_finished(self):
+        worker_id = self._sender_worker_id()
+        if worker_id is not None:
+            self._on_worker_finished(worker_id)
+    
+    @pyqtSlot()
+    def _slot_progress(self):
+        worker_id = self._sender_worker_id()
+        if worker_id is not None:
+            self._on_worker_progress(worker_id, "")
+    
+    @pyqtSlot(str)
+    def _slot_error(self, message: str):
+        worker_id = self._sender_worker_id()
+        if worker_id is not None:
+            self._on_worker_error(worker_id, message)
+    
+    @pyqtSlot()
+    def _slot_analysis_complete(self):
+        worker_id = self._sender_worker_id()
+        if worker_id is not None:
+            self._on_worker_completed(worker_id, True)
+    
+    @pyqtSlot(bool, str)
+    def _slot_organize_complete(self, success: bool, message: str):
+        worker_id = self._sender_worker_id()
+        if worker_id is not None:
+            self._on_worker_completed(worker_id, success)
     
     def _on_worker_finished(self, worker_id: str):
         """Maneja la finalización de un worker"""
         with self.lock:
-            if worker_id in self.active_workers:
-                worker_info = self.active_workers[worker_id]
-                
-                if worker_info.status == WorkerStatus.RUNNING:
-                    worker_info.status = WorkerStatus.COMPLETED
-                    worker_info.completed_at = time.time()
-                
-                # Mover a historial
-                self.worker_history.append(worker_info)
-                
-                # Limpiar registro activo
-                del self.active_workers[worker_id]
-                
-                # Desregistrar de ApplicationState (lazy import)
-                app_state = _get_app_state()
-                app_state.unregister_worker(worker_id)
-                
-                # Desregistrar de MemoryManager (lazy import)
-                memory_manager = _get_memory_manager()
-                memory_manager.unregister_worker(worker_id)
-                
-                # Emitir señal
-                success = worker_info.status == WorkerStatus.COMPLETED
-                self.worker_completed.emit(worker_id, success)
-                
-                print(f"Worker {worker_id} finalizado: {worker_info.status.value}")
+            worker_info = self.active_workers.get(worker_id)
+            if worker_info is None:
+                return
+            
+            if worker_info.status == WorkerStatus.RUNNING:
+                self._set_status(worker_info, WorkerStatus.COMPLETED)
+                worker_info.completed_at_ns = time.monotonic_ns()
+            
+            # Limpiar registro activo
+            del self.active_workers[worker_id]
+            self._id_by_thread.pop(id(worker_info.worker), None)
+            
+            # Mover a historial sin retener el QThread ni sus resultados
+            self._release_worker(worker_info)
+            self.worker_history.append(worker_info)
+            
+            status = worker_info.status
+        
+        self._unregister_from_managers(worker_id)
+        
+        # Emitir señal
+        self.worker_completed.emit(worker_id, status == WorkerStatus.COMPLETED)
+        if LOG_WORKER_LIFECYCLE:
+            debug(f"Worker {worker_id} finalizado: {status.label}")
+    
+    @staticmethod
+    def _release_worker(worker_info: WorkerInfo):
+        """Sustituye la referencia fuerte al QThread por una débil"""
+        worker = worker_info.worker
+        worker_info.worker = None
+        if worker is not None:
+            try:
+                worker_info.worker_ref = weakref.ref(worker)
+            except TypeError:
+                pass
+    
+    def _unregister_from_managers(self, worker_id: str):
+        """Desregistra el worker de ApplicationState y MemoryManager (sin lock)"""
+        _get_app_state().unregister_worker(worker_id)
+        _get_memory_manager().unregister_worker(worker_id)
     
     def _on_worker_progress(self, worker_id: str, message: str):
         """Maneja actualizaciones de progreso del worker"""
         with self.lock:
-            if worker_id in self.active_workers:
-                worker_info = self.active_workers[worker_id]
-                
-                # Actualizar progreso (simplificado)
-                worker_info.progress = min(worker_info.progress + 0.1, 1.0)
-                
-                self.worker_progress.emit(worker_id, worker_info.progress)
+            worker_info = self.active_workers.get(worker_id)
+            if worker_info is None:
+                return
+            
+            # Actualizar progreso (simplificado)
+            progress = min(worker_info.progress + 0.1, 1.0)
+            worker_info.progress = progress
+            
+            # Limitar la emisión a un frame (~16 ms) salvo avance >= 1%
+            now = time.monotonic()
+            if (
+                now - worker_info.last_emit_ts < PROGRESS_EMIT_INTERVAL
+                and progress - worker_info.last_emitted_progress < PROGRESS_EMIT_DELTA
+            ):
+                return
+            worker_info.last_emit_ts = now
+            worker_info.last_emitted_progress = progress
+        
+        self.worker_progress.emit(worker_id, progress)
     
     def _on_worker_error(self, worker_id: str, error_message: str):
         """Maneja errores del worker"""
         with self.lock:
-            if worker_id in self.active_workers:
-                worker_info = self.active_workers[worker_id]
-                worker_info.status = WorkerStatus.ERROR
-                worker_info.error_message = error_message
-                
-                self.worker_error.emit(worker_id, error_message)
-                print(f"Error en worker {worker_id}: {error_message}")
+            worker_info = self.active_workers.get(worker_id)
+            if worker_info is None:
+                return
+            self._set_status(worker_info, WorkerStatus.ERROR)
+            worker_info.error_message = error_message
+        
+        self.worker_error.emit(worker_id, error_message)
+        error(f"Error en worker {worker_id}: {error_message}")
     
     def _on_worker_completed(self, worker_id: str, success: bool):
         """Maneja completación exitosa del worker"""
         with self.lock:
             if worker_id in self.active_workers:
                 worker_info = self.active_workers[worker_id]
-                worker_info.status = WorkerStatus.COMPLETED if success else WorkerStatus.ERROR
-                worker_info.completed_at = time.time()
+                self._set_status(
+                    worker_info,
+                    WorkerStatus.COMPLETED if success else WorkerStatus.ERROR,
+                )
+                worker_info.completed_at_ns = time.monotonic_ns()
     
     def cancel_worker(self, worker_id: str) -> bool:
         """Cancela un worker activo"""
         with self.lock:
-            if worker_id not in self.active_workers:
-                return False
-            
-            worker_info = self.active_workers[worker_id]
-            
-            try:
-                # Intentar cancelar el worker
-                if hasattr(worker_info.worker, 'terminate'):
-                    worker_info.worker.terminate()
-                elif hasattr(worker_info.worker, 'stop'):
-                    worker_info.worker.stop()
-                
-                worker_info.status = WorkerStatus.CANCELLED
-                worker_info.completed_at = time.time()
-                
-                # Limpiar registro
-                del self.active_workers[worker_id]
-                
-                # Desregistrar de managers (lazy import)
-                app_state = _get_app_state()
-                app_state.unregister_worker(worker_id)
-                memory_manager = _get_memory_manager()
-                memory_manager.unregister_worker(worker_id)
-                
-                print(f"Worker {worker_id} cancelado")
-                return True
-                
-            except Exception as e:
-                print(f"Error cancelando worker {worker_id}: {e}")
-                return False
+            worker = self._cancel_worker_locked(worker_id)
+        
+        if worker is None:
+            return False
+        
+        try:
+            self._wait_or_terminate(worker)
+            self._unregister_from_managers(worker_id)
+        except Exception as e:
+            error(f"Error cancelando worker {worker_id}: {e}")
+            return False
+        
+        if LOG_WORKER_LIFECYCLE:
+            debug(f"Worker {worker_id} cancelado")
+        return True
+    
+    def _cancel_worker_locked(self, worker_id: str) -> Optional[QThread]:
+        """
+        Pide la parada cooperativa de un worker y lo retira de los activos
+        (requiere self.lock)
+        
+        Returns:
+            QThread: El worker, que el llamador debe esperar fuera del lock
+        """
+        worker_info = self.active_workers.get(worker_id)
+        if worker_info is None:
+            return None
+        
+        worker = worker_info.worker
+        try:
+            self._request_stop(worker)
+        except Exception as e:
+            error(f"Error cancelando worker {worker_id}: {e}")
+            return None
+        
+        self._set_status(worker_info, WorkerStatus.CANCELLED)
+        worker_info.completed_at_ns = time.monotonic_ns()
+        
+        # Limpiar registro
+        del self.active_workers[worker_id]
+        self._id_by_thread.pop(id(worker), None)
+        return worker
+    
+    @staticmethod
+    def _request_stop(worker: QThread):
+        """Parada cooperativa: stop() del worker o requestInterruption() de Qt"""
+        stop = getattr(worker, 'stop', None)
+        if stop is not None:
+            stop()
+        else:
+            worker.requestInterruption()
+    
+    @staticmethod
+    def _wait_or_terminate(worker: QThread, timeout_ms: int = CANCEL_WAIT_MS):
+        """Espera a que el worker termine y solo lo fuerza si no lo hace a tiempo"""
+        if not worker.wait(timeout_ms):
+            worker.terminate()
+            worker.wait()
     
     def cancel_all_workers(self):
         """Cancela todos los workers activos"""
+        # Primero se pide la parada a todos, en una sola sección crítica...
         with self.lock:
-            worker_ids = list(self.active_workers.keys())
-            
-            for worker_id in worker_ids:
-                self.cancel_worker(worker_id)
-            
-            print(f"Cancelados {len(worker_ids)} workers")
+            cancelled = []
+            for worker_id in list(self.active_workers):
+                worker = self._cancel_worker_locked(worker_id)
+                if worker is not None:
+                    cancelled.append((worker_id, worker))
+        
+        # ...y después se espera a cada uno, forzando solo a los rezagados
+        for worker_id, worker in cancelled:
+            try:
+                self._wait_or_terminate(worker)
+                self._unregister_from_managers(worker_id)
+            except Exception as e:
+                error(f"Error cancelando worker {worker_id}: {e}")
+        
+        if LOG_WORKER_LIFECYCLE:
+            debug(f"Cancelados {len(cancelled)} workers")
     
     def get_worker_status(self, worker_id: str) -> Optional[WorkerStatus]:
         """Obtiene el estado de un worker"""
@@ -367,43 +601,59 @@ class WorkerManager(QObject):
                 return self.active_workers[worker_id].status
             return None
     
-    def get_active_workers(self) -> Dict[str, WorkerInfo]:
-        """Obtiene información de workers activos"""
+    def get_active_workers(self) -> Mapping[str, WorkerInfo]:
+        """
+        Obtiene una vista de solo lectura de los workers activos
+        
+        La vista refleja los cambios en vivo: para iterarla mientras otros
+        hilos inician o terminan workers, usar snapshot_active_workers().
+        """
+        return self._active_view
+    
+    def snapshot_active_workers(self) -> Tuple[Tuple[str, str, WorkerStatus], ...]:
+        """Obtiene una instantánea (worker_id, worker_type, status) de los workers activos"""
         with self.lock:
-            return self.active_workers.copy()
+            return tuple(
+                (worker_id, worker_info.worker_type, worker_info.status)
+                for worker_id, worker_info in self.active_workers.items()
+            )
     
     def get_worker_history(self) -> List[WorkerInfo]:
         """Obtiene el historial de workers"""
         with self.lock:
-            return self.worker_history.copy()
+            return list(self.worker_history)
     
     def cleanup_old_history(self, max_history: int = 100):
-        """Limpia el historial antiguo de workers"""
+        """
+        Limpia el historial antiguo de workers
+
+        El historial ya está acotado por su deque; solo se reconstruye si
+        cambia el tamaño máximo.
+        """
         with self.lock:
-            if len(self.worker_history) > max_history:
-                self.worker_history = self.worker_history[-max_history:]
+            if max_history != self.worker_history.maxlen:
+                self.max_history = max_history
+                self.worker_history = deque(self.worker_history, maxlen=max_history)
     
     def get_worker_stats(self) -> Dict[str, Any]:
         """Obtiene estadísticas de workers"""
+        by_type: Counter = Counter()
+        by_status: Counter = Counter()
         with self.lock:
-            stats = {
-                "active_workers": len(self.active_workers),
-                "total_history": len(self.worker_history),
-                "workers_by_type": {},
-                "workers_by_status": {}
-            }
-            
-            # Contar por tipo
+            # Contar por tipo y por estado en una sola pasada
             for worker_info in self.active_workers.values():
-                worker_type = worker_info.worker_type
-                stats["workers_by_type"][worker_type] = stats["workers_by_type"].get(worker_type, 0) + 1
+                by_type[worker_info.worker_type] += 1
+                by_status[worker_info.status] += 1
             
-            # Contar por estado
-            for worker_info in self.active_workers.values():
-                status = worker_info.status.value
-                stats["workers_by_status"][status] = stats["workers_by_status"].get(status, 0) + 1
-            
-            return stats
+            active_count = len(self.active_workers)
+            history_count = len(self.worker_history)
+        
+        return {
+            "active_workers": active_count,
+            "total_history": history_count,
+            "workers_by_type": dict(by_type),
+            "workers_by_status": {status.label: count for status, count in by_status.items()}
+        }
     
     def cleanup(self):
         """Limpieza completa del gestor de workers"""
@@ -423,10 +673,11 @@ class WorkerManager(QObject):
                 except:
                     pass
             
-            print("WorkerManager limpiado correctamente")
+            if LOG_WORKER_LIFECYCLE:
+                debug("WorkerManager limpiado correctamente")
             
         except Exception as e:
-            print(f"Error en limpieza de WorkerManager: {e}")
+            error(f"Error en limpieza de WorkerManager: {e}")
 
 
 # ===== LAZY INITIALIZATION PARA WORKER_MANAGER =====
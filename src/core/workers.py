@@ -6,11 +6,16 @@ Maneja el procesamiento en segundo plano para análisis y organización
 
 import os
 import shutil
+import time
 import mimetypes
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
@@ -27,6 +32,113 @@ from .organization_conflicts import (
 )
 
 
+# Tipo y descripción por extensión para el análisis avanzado (una consulta O(1)
+# por archivo en lugar de una cadena de comprobaciones sobre listas)
+_EXT_TYPE_MAP = {
+    **dict.fromkeys(
+        (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"),
+        ("image", "Imagen"),
+    ),
+    **dict.fromkeys(
+        (".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"),
+        ("video", "Video"),
+    ),
+    **dict.fromkeys(
+        (".pdf", ".doc", ".docx", ".txt", ".rtf"),
+        ("document", "Documento"),
+    ),
+    **dict.fromkeys(
+        (".zip", ".rar", ".7z", ".tar", ".gz"),
+        ("archive", "Archivo comprimido"),
+    ),
+    **dict.fromkeys(
+        (".exe", ".msi", ".deb", ".rpm", ".dmg"),
+        ("executable", "Ejecutable"),
+    ),
+}
+
+
+# CARPETAS DEL SISTEMA CRÍTICAS que SÍ deben filtrarse
+_SYSTEM_FOLDER_NAMES = frozenset(
+    {
+        "program files",
+        "program files (x86)",
+        "windows",
+        "windowsapps",
+        "wpsystem",
+        "system volume information",
+        "$recycle.bin",
+        "recovery",
+        "config.msi",
+        "msdownld.tmp",  # Solo si es del sistema, no del usuario
+    }
+)
+
+# Componentes de ruta que indican que se está dentro de Windows o Program Files
+_SYSTEM_PATH_PARTS = frozenset(
+    {"windows", "program files", "program files (x86)", "windowsapps"}
+)
+
+
+@lru_cache(maxsize=1024)
+def _is_in_system_tree(path: str) -> bool:
+    """Indica si algún componente de la ruta es una carpeta del sistema"""
+    return any(part.lower() in _SYSTEM_PATH_PARTS for part in Path(path).parts)
+
+
+# Heurísticas por nombre de archivo cuando ni la extensión ni el MIME deciden
+_NAME_TOKEN_MAP = {
+    "MUSICA": ("track", "album", "song", "mix", "audio"),
+    "VIDEOS": ("movie", "trailer", "video", "clip", "episode"),
+    "IMAGENES": ("img", "screenshot", "photo", "wallpaper", "camera"),
+    "DOCUMENTOS": (
+        "invoice",
+        "report",
+        "manual",
+        "doc",
+        "cv",
+        "resume",
+        "readme",
+    ),
+    "CODIGO": ("package", "docker", "config", "script", "source", "setup"),
+}
+
+
+class ProgressBuffer:
+    """Agrupa mensajes de progreso para no saturar el bucle de eventos de Qt
+
+    Los mensajes pendientes se emiten juntos, separados por saltos de línea,
+    cada ``max_items`` mensajes o cada ``interval`` segundos. Solo debe usarse
+    desde el hilo del worker; hay que llamar a flush() antes de las señales
+    finales para no perder los últimos mensajes. Los receptores separan el
+    lote por líneas (MainWindow._handle_task_progress) para registrar cada
+    mensaje por separado.
+    """
+
+    def __init__(self, emit, max_items: int = 50, interval: float = 0.1):
+        self._emit = emit
+        self._pending: List[str] = []
+        self._max_items = max_items
+        self._interval = interval
+        self._last_flush = 0.0
+
+    def queue(self, message: str):
+        """Encola un mensaje y emite el lote si toca"""
+        self._pending.append(message)
+        if (
+            len(self._pending) >= self._max_items
+            or time.monotonic() - self._last_flush >= self._interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Emite inmediatamente los mensajes pendientes"""
+        if self._pending:
+            self._emit("\n".join(self._pending))
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+
 class AnalysisWorker(QThread):
     """Worker para analizar carpetas y archivos en segundo plano"""
 
@@ -34,6 +146,7 @@ class AnalysisWorker(QThread):
     progress_update = pyqtSignal(str)
     analysis_complete = pyqtSignal(list, list, dict)
     error_occurred = pyqtSignal(str)
+    analysis_cancelled = pyqtSignal()
 
     def __init__(
         self,
@@ -45,6 +158,7 @@ class AnalysisWorker(QThread):
         min_file_size_mb: int = 0,
         ignored_extensions: Optional[List[str]] = None,
         ignored_paths: Optional[List[str]] = None,
+        compute_hashes: bool = False,
     ):
         super().__init__()
         self.folder_path = folder_path
@@ -63,31 +177,46 @@ class AnalysisWorker(QThread):
             for path in (ignored_paths or [])
             if str(path).strip()
         ]
+        # El hash de cada archivo suelto obliga a leerlo entero; nada en el
+        # análisis lo usa, así que solo se calcula si se pide explícitamente
+        self.compute_hashes = compute_hashes
+        # Hay pocas extensiones distintas: la categoría por extensión (mapa y
+        # MIME) se memoiza; lru_cache es seguro entre los hilos del escaneo
+        self._category_for_ext = lru_cache(maxsize=512)(self._category_from_extension)
         self.hash_manager = HashManager()
+        self._progress = ProgressBuffer(self.progress_update.emit)
         self.is_running = True
 
     def run(self):
         """Ejecuta el análisis de la carpeta"""
         try:
-            self.progress_update.emit("🔍 Iniciando análisis de la carpeta...")
+            self._progress.queue("🔍 Iniciando análisis de la carpeta...")
 
             # Analizar carpetas
             folder_movements = self.analyze_folders()
-            self.progress_update.emit(f"📁 Analizadas {len(folder_movements)} carpetas")
+            if not self.is_running:
+                # Detenido durante el escaneo: no se publican resultados parciales
+                self._progress.queue("⏹️ Análisis detenido")
+                self._progress.flush()
+                self.analysis_cancelled.emit()
+                return
+            self._progress.queue(f"📁 Analizadas {len(folder_movements)} carpetas")
 
             # Analizar archivos sueltos
             file_movements = self.analyze_loose_files()
-            self.progress_update.emit(
+            self._progress.queue(
                 f"📄 Analizados {len(file_movements)} archivos sueltos"
             )
 
             # Calcular estadísticas
             stats = self.calculate_statistics(folder_movements, file_movements)
 
-            self.progress_update.emit("✅ Análisis completado exitosamente")
+            self._progress.queue("✅ Análisis completado exitosamente")
+            self._progress.flush()
             self.analysis_complete.emit(folder_movements, file_movements, stats)
 
         except Exception as e:
+            self._progress.flush()
             self.error_occurred.emit(f"❌ Error durante el análisis: {str(e)}")
 
     def analyze_folders(self) -> List[Dict[str, Any]]:
@@ -98,157 +227,197 @@ class AnalysisWorker(QThread):
         if not folder_path.exists() or not folder_path.is_dir():
             return folder_movements
 
-        # Obtener solo carpetas (no archivos)
-        folders = [item for item in folder_path.iterdir() if item.is_dir()]
+        # Obtener solo carpetas (no archivos); DirEntry ya trae el tipo
+        with os.scandir(folder_path) as entries:
+            folders = [entry for entry in entries if entry.is_dir()]
 
-        for folder in folders:
+        # Filtrar en serie las carpetas excluidas o del sistema
+        to_scan = []
+        for entry in folders:
             try:
                 # FILTRO INTELIGENTE: Solo excluir carpetas del sistema críticas
-                if self.is_excluded_path(folder) or self.is_system_folder(folder):
-                    self.progress_update.emit(
-                        f"🚫 Excluyendo carpeta del sistema: {folder.name}"
+                if self.is_excluded_path(entry) or self.is_system_folder(entry):
+                    self._progress.queue(
+                        f"🚫 Excluyendo carpeta del sistema: {entry.name}"
                     )
                     continue
-
-                # Analizar contenido de la carpeta
-                total_files, total_size, category_counts = self.analyze_folder_content(
-                    folder
+                to_scan.append(Path(entry.path))
+            except Exception as e:
+                self._progress.queue(
+                    f"⚠️ Error analizando carpeta {entry.name}: {str(e)}"
                 )
 
-                if total_files > 0:
-                    # Determinar categoría principal
-                    main_category = max(category_counts.items(), key=lambda x: x[1])[0]
-                    percentage = (category_counts[main_category] / total_files) * 100
-                    assigned_category = (
-                        main_category if percentage >= self.min_percentage else "VARIOS"
-                    )
-                    # Si la carpeta es demasiado heterogénea para el umbral elegido,
-                    # se conserva visible en resultados pero se envía a VARIOS para
-                    # evitar clasificaciones agresivas e incorrectas.
+        if not to_scan:
+            return folder_movements
 
-                    movement = {
-                        "folder": folder,
-                        "category": assigned_category,
-                        "matched_category": main_category,
-                        "total_files": total_files,
-                        "size": total_size,
-                        "percentage": percentage,
-                        "extension": "carpeta",
-                        "category_counts": category_counts,
-                        "is_expandable": True,
-                        "below_similarity_threshold": percentage < self.min_percentage,
-                    }
-                    folder_movements.append(movement)
-                    if percentage < self.min_percentage:
-                        self.progress_update.emit(
-                            f"📁 Carpeta marcada como VARIOS: {folder.name} ({percentage:.1f}% {main_category}, umbral {self.min_percentage}%)"
+        # 🚀 Escanear las carpetas en paralelo: el trabajo es casi todo espera
+        # de E/S, que libera el GIL. Los resultados se consumen en orden en este
+        # hilo, así que las señales se siguen emitiendo desde el QThread.
+        executor = ThreadPoolExecutor(
+            max_workers=min(32, len(to_scan)), thread_name_prefix="analysis"
+        )
+        try:
+            results = executor.map(self._scan_folder, to_scan)
+            for folder, (total_files, total_size, category_counts, warning) in zip(
+                to_scan, results
+            ):
+                if not self.is_running:
+                    break
+                if warning:
+                    self._progress.queue(warning)
+
+                try:
+                    if total_files > 0:
+                        # Determinar categoría principal
+                        main_category, main_count = max(
+                            category_counts.items(), key=itemgetter(1)
+                        )
+                        percentage = main_count * 100.0 / total_files
+                        assigned_category = (
+                            main_category if percentage >= self.min_percentage else "VARIOS"
                         )
+                        # Si la carpeta es demasiado heterogénea para el umbral elegido,
+                        # se conserva visible en resultados pero se envía a VARIOS para
+                        # evitar clasificaciones agresivas e incorrectas.
+
+                        movement = {
+                            "folder": folder,
+                            "category": assigned_category,
+                            "matched_category": main_category,
+                            "total_files": total_files,
+                            "size": total_size,
+                            "percentage": percentage,
+                            "extension": "carpeta",
+                            "category_counts": category_counts,
+                            "is_expandable": True,
+                            "below_similarity_threshold": percentage < self.min_percentage,
+                        }
+                        folder_movements.append(movement)
+                        if percentage < self.min_percentage:
+                            self._progress.queue(
+                                f"📁 Carpeta marcada como VARIOS: {folder.name} ({percentage:.1f}% {main_category}, umbral {self.min_percentage}%)"
+                            )
+                        else:
+                            self._progress.queue(
+                                f"📁 Carpeta incluida: {folder.name} ({percentage:.1f}% {main_category})"
+                            )
                     else:
-                        self.progress_update.emit(
-                            f"📁 Carpeta incluida: {folder.name} ({percentage:.1f}% {main_category})"
+                        # Carpeta vacía - incluirla también
+                        movement = {
+                            "folder": folder,
+                            "category": "VARIOS",
+                            "total_files": 0,
+                            "size": 0,
+                            "percentage": 0,
+                            "extension": "carpeta",
+                            "category_counts": Counter(),
+                            "is_expandable": True,
+                        }
+                        folder_movements.append(movement)
+                        self._progress.queue(
+                            f"📁 Carpeta vacía incluida: {folder.name}"
                         )
-                else:
-                    # Carpeta vacía - incluirla también
-                    movement = {
-                        "folder": folder,
-                        "category": "VARIOS",
-                        "total_files": 0,
-                        "size": 0,
-                        "percentage": 0,
-                        "extension": "carpeta",
-                        "category_counts": Counter(),
-                        "is_expandable": True,
-                    }
-                    folder_movements.append(movement)
-                    self.progress_update.emit(
-                        f"📁 Carpeta vacía incluida: {folder.name}"
-                    )
 
-            except Exception as e:
-                self.progress_update.emit(
-                    f"⚠️ Error analizando carpeta {folder.name}: {str(e)}"
-                )
+                except Exception as e:
+                    self._progress.queue(
+                        f"⚠️ Error analizando carpeta {folder.name}: {str(e)}"
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return folder_movements
 
     def analyze_folder_content(self, folder_path: Path) -> tuple:
         """Analiza el contenido de una carpeta específica"""
+        total_files, total_size, category_counts, warning = self._scan_folder(
+            folder_path
+        )
+        if warning:
+            self._progress.queue(warning)
+        return total_files, total_size, category_counts
+
+    def _scan_folder(self, folder_path: Path) -> tuple:
+        """Cuenta archivos, tamaño y categorías de una carpeta sin emitir señales.
+
+        Se ejecuta en los hilos del pool de analyze_folders; los avisos se
+        devuelven como cuarto elemento para que los emita el QThread.
+        """
+        warning = None
         total_files = 0
         total_size = 0
-        category_counts = Counter()
+        category_counts = defaultdict(int)
+        # Histograma por extensión: la categoría de cada extensión distinta se
+        # resuelve una sola vez al final, no una vez por archivo
+        ext_counts: Dict[str, int] = {}
+        category_for_ext = self._category_for_ext
 
         try:
             # Intentar acceder al contenido de la carpeta
-            for item in folder_path.iterdir():
-                try:
-                    if item.is_file():
-                        if self._should_skip_file(item):
-                            continue
-                        total_files += 1
-                        try:
-                            total_size += item.stat().st_size
-                        except (OSError, PermissionError):
-                            # Si no se puede obtener el tamaño, continuar
-                            pass
-
-                        # Categorizar archivo
-                        category = self._categorize_path(item)
-                        category_counts[category] += 1
-
-                except (PermissionError, OSError):
-                    # Ignorar archivos individuales sin permisos
-                    continue
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if self._should_skip_file(entry):
+                                continue
+                            total_files += 1
+                            # Consultar la parada solo cada 1024 archivos
+                            if (total_files & 0x3FF) == 0 and not self.is_running:
+                                break
+                            try:
+                                total_size += entry.stat().st_size
+                            except (OSError, PermissionError):
+                                # Si no se puede obtener el tamaño, continuar
+                                pass
+
+                            # Categorizar archivo
+                            name = entry.name
+                            extension = os.path.splitext(name)[1].lower()
+                            if extension in ext_counts:
+                                ext_counts[extension] += 1
+                            elif category_for_ext(extension):
+                                ext_counts[extension] = 1
+                            else:
+                                category_counts[self._categorize_by_name(name)] += 1
+
+                    except (PermissionError, OSError):
+                        # Ignorar archivos individuales sin permisos
+                        continue
 
         except PermissionError:
-            self.progress_update.emit(
-                f"⚠️ Sin permisos para acceder a {folder_path.name}"
-            )
+            warning = f"⚠️ Sin permisos para acceder a {folder_path.name}"
         except Exception as e:
-            self.progress_update.emit(
-                f"⚠️ Error analizando contenido de {folder_path.name}: {str(e)}"
-            )
+            warning = f"⚠️ Error analizando contenido de {folder_path.name}: {str(e)}"
 
-        return total_files, total_size, category_counts
+        for extension, count in ext_counts.items():
+            category_counts[category_for_ext(extension)] += count
 
-    def is_system_folder(self, folder_path: Path) -> bool:
-        """Determina si una carpeta es del sistema y debe ser excluida"""
-        folder_name = folder_path.name.lower()
-
-        # CARPETAS DEL SISTEMA CRÍTICAS que SÍ deben filtrarse
-        system_folders = {
-            "program files",
-            "program files (x86)",
-            "windows",
-            "windowsapps",
-            "wpsystem",
-            "system volume information",
-            "$recycle.bin",
-            "recovery",
-            "config.msi",
-            "msdownld.tmp",  # Solo si es del sistema, no del usuario
-        }
+        return total_files, total_size, category_counts, warning
+
+    def is_system_folder(self, entry: os.DirEntry) -> bool:
+        """Determina si una carpeta es del sistema y debe ser excluida
+
+        Recibe el DirEntry de os.scandir: en Windows su stat() va en caché, así
+        que la comprobación no añade llamadas al sistema.
+        """
+        folder_name = entry.name.lower()
 
         # Verificar si es carpeta del sistema
-        if folder_name in system_folders:
+        if folder_name in _SYSTEM_FOLDER_NAMES:
             return True
 
-        # Verificar si está en rutas del sistema
+        # Verificar si está en rutas del sistema (C:\Windows o C:\Program Files);
+        # las carpetas hermanas comparten padre, así que la consulta va en caché
         try:
-            # Verificar si está en C:\Windows o C:\Program Files
-            if (
-                "windows" in str(folder_path).lower()
-                or "program files" in str(folder_path).lower()
-            ):
+            if _is_in_system_tree(os.path.dirname(entry.path)):
                 return True
         except:
             pass
 
-        # Verificar si es carpeta oculta del sistema
+        # Verificar si es carpeta oculta del sistema (el nombre primero: solo
+        # se consultan los atributos de las que empiezan por $ o .)
         try:
-            if (
-                folder_path.is_dir() and folder_path.stat().st_file_attributes & 0x2
-            ):  # Hidden
-                if folder_name.startswith("$") or folder_name.startswith("."):
+            if folder_name.startswith(("$", ".")):
+                if entry.stat(follow_symlinks=False).st_file_attributes & 0x2:  # Hidden
                     return True
         except:
             pass
@@ -261,59 +430,64 @@ class AnalysisWorker(QThread):
         contents = []
 
         try:
-            for item in folder_path.iterdir():
-                try:
-                    if item.is_file():
-                        if self._should_skip_file(item):
-                            continue
-                        # Archivo individual
-                        file_size = 0
-                        try:
-                            file_size = item.stat().st_size
-                        except (OSError, PermissionError):
-                            pass
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if self._should_skip_file(entry):
+                                continue
+                            # Archivo individual
+                            file_size = 0
+                            try:
+                                file_size = entry.stat().st_size
+                            except (OSError, PermissionError):
+                                pass
+
+                            extension = os.path.splitext(entry.name)[1].lower()
+                            category = self._categorize_path(entry)
 
-                        extension = item.suffix.lower()
-                        category = self._categorize_path(item)
-
-                        contents.append(
-                            {
-                                "type": "file",
-                                "path": item,
-                                "name": item.name,
-                                "size": file_size,
-                                "category": category,
-                                "extension": extension,
-                            }
-                        )
-                    elif item.is_dir():
-                        # Subcarpeta
-                        try:
-                            sub_files = len([f for f in item.iterdir() if f.is_file()])
                             contents.append(
                                 {
-                                    "type": "subfolder",
-                                    "path": item,
-                                    "name": item.name,
-                                    "file_count": sub_files,
-                                    "is_expandable": True,
+                                    "type": "file",
+                                    "path": Path(entry.path),
+                                    "name": entry.name,
+                                    "size": file_size,
+                                    "category": category,
+                                    "extension": extension,
                                 }
                             )
-                        except (PermissionError, OSError):
-                            # Subcarpeta sin permisos
-                            contents.append(
-                                {
-                                    "type": "subfolder",
-                                    "path": item,
-                                    "name": item.name,
-                                    "file_count": 0,
-                                    "is_expandable": False,
-                                    "no_access": True,
-                                }
-                            )
-
-                except (PermissionError, OSError):
-                    continue
+                        elif entry.is_dir():
+                            # Subcarpeta
+                            item = Path(entry.path)
+                            try:
+                                with os.scandir(entry.path) as sub_entries:
+                                    sub_files = sum(
+                                        1 for sub in sub_entries if sub.is_file()
+                                    )
+                                contents.append(
+                                    {
+                                        "type": "subfolder",
+                                        "path": item,
+                                        "name": entry.name,
+                                        "file_count": sub_files,
+                                        "is_expandable": True,
+                                    }
+                                )
+                            except (PermissionError, OSError):
+                                # Subcarpeta sin permisos
+                                contents.append(
+                                    {
+                                        "type": "subfolder",
+                                        "path": item,
+                                        "name": entry.name,
+                                        "file_count": 0,
+                                        "is_expandable": False,
+                                        "no_access": True,
+                                    }
+                                )
+
+                    except (PermissionError, OSError):
+                        continue
 
         except PermissionError:
             self.progress_update.emit(
@@ -336,24 +510,30 @@ class AnalysisWorker(QThread):
 
         try:
             # Obtener solo archivos (no carpetas)
-            files = [item for item in folder_path.iterdir() if item.is_file()]
+            with os.scandir(folder_path) as entries:
+                files = [entry for entry in entries if entry.is_file()]
 
-            for file in files:
+            for entry in files:
+                file = Path(entry.path)
                 try:
                     # Información básica del archivo
-                    if self._should_skip_file(file):
+                    if self._should_skip_file(entry):
                         continue
-                    file_size = file.stat().st_size
-                    extension = file.suffix.lower()
-                    file_date = file.stat().st_mtime
+                    # DirEntry.stat() se cachea en la entrada: el filtro de
+                    # tamaño mínimo, este bloque y el análisis avanzado
+                    # comparten una única llamada al sistema
+                    file_stat = entry.stat()
+                    file_size = file_stat.st_size
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    file_date = file_stat.st_mtime
 
                     # Categorizar archivo
-                    category = self._categorize_path(file)
+                    category = self._categorize_path(entry)
 
                     # Análisis avanzado (si está habilitado)
                     advanced_info = {}
                     if self.advanced_analysis:
-                        advanced_info = self._get_advanced_file_info(file)
+                        advanced_info = self._get_advanced_file_info(file, file_stat)
 
                     # Crear diccionario completo del archivo
                     movement = {
@@ -380,33 +560,40 @@ class AnalysisWorker(QThread):
                     file_movements.append(movement)
 
                 except Exception as e:
-                    self.progress_update.emit(
+                    self._progress.queue(
                         f"⚠️ Error analizando archivo {file.name}: {str(e)}"
                     )
 
         except Exception as e:
-            self.progress_update.emit(
+            self._progress.queue(
                 f"⚠️ Error accediendo a archivos sueltos: {str(e)}"
             )
 
         return file_movements
 
-    def _get_advanced_file_info(self, file_path: Path) -> Dict[str, Any]:
-        """Obtiene información avanzada de un archivo"""
+    def _get_advanced_file_info(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Obtiene información avanzada de un archivo
+
+        Las fechas se guardan como timestamps (float); convertirlas a datetime
+        queda para quien las muestre. Si ya se tiene el stat del archivo, se
+        pasa en stat_result para no repetir la llamada al sistema.
+        """
         info = {"type": "file", "description": "", "metadata": {}, "hash": None}
 
         try:
             # Obtener información básica
-            stat = file_path.stat()
+            stat = stat_result if stat_result is not None else file_path.stat()
             info["metadata"] = {
                 "size_bytes": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime),
-                "modified": datetime.fromtimestamp(stat.st_mtime),
-                "accessed": datetime.fromtimestamp(stat.st_atime),
+                "created": stat.st_ctime,
+                "modified": stat.st_mtime,
+                "accessed": stat.st_atime,
             }
 
-            # Calcular hash para archivos pequeños (optimización)
-            if stat.st_size < 50 * 1024 * 1024:  # Menos de 50MB
+            # Calcular hash para archivos pequeños (solo bajo demanda)
+            if self.compute_hashes and stat.st_size < 50 * 1024 * 1024:  # Menos de 50MB
                 hash_value = self.hash_manager.calculate_file_hash(file_path, "md5")
                 if hash_value:
                     info["hash"] = hash_value
@@ -440,46 +627,43 @@ class AnalysisWorker(QThread):
                         }
                     }
                 )
-                info["metadata"]["size_bytes"] = stat.st_size
-                info["metadata"]["created"] = datetime.fromtimestamp(stat.st_ctime)
-                info["metadata"]["modified"] = datetime.fromtimestamp(stat.st_mtime)
-                info["metadata"]["accessed"] = datetime.fromtimestamp(stat.st_atime)
-                if not info.get("hash") and stat.st_size < 50 * 1024 * 1024:
-                    hash_value = self.hash_manager.calculate_file_hash(file_path, "md5")
-                    if hash_value:
-                        info["hash"] = hash_value
-            elif ext in [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp"]:
-                info["type"] = "image"
-                info["description"] = "Imagen"
-            elif ext in [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm"]:
-                info["type"] = "video"
-                info["description"] = "Video"
-            elif ext in [".pdf", ".doc", ".docx", ".txt", ".rtf"]:
-                info["type"] = "document"
-                info["description"] = "Documento"
-            elif ext in [".zip", ".rar", ".7z", ".tar", ".gz"]:
-                info["type"] = "archive"
-                info["description"] = "Archivo comprimido"
-            elif ext in [".exe", ".msi", ".deb", ".rpm", ".dmg"]:
-                info["type"] = "executable"
-                info["description"] = "Ejecutable"
             else:
-                info["type"] = "file"
-                info["description"] = f"Archivo {ext.upper()}"
+                info["type"], info["description"] = _EXT_TYPE_MAP.get(
+                    ext, ("file", f"Archivo {ext.upper()}")
+                )
 
         except Exception as e:
             info["description"] = f"Error obteniendo información: {str(e)}"
 
         return info
 
-    def _categorize_path(self, file_path: Path) -> str:
+    def _categorize_path(self, file_path: Path | os.DirEntry) -> str:
         """Categoriza con este orden: extensión, MIME, heurísticas por nombre y VARIOS."""
-        extension = file_path.suffix.lower()
+        name = file_path.name
+        category = self._category_for_ext(os.path.splitext(name)[1].lower())
+        if category:
+            return category
+        return self._categorize_by_name(name)
+
+    @staticmethod
+    def _categorize_by_name(name: str) -> str:
+        """Heurísticas por nombre de archivo; VARIOS si ninguna encaja."""
+        filename = name.lower()
+        for guessed_category, tokens in _NAME_TOKEN_MAP.items():
+            if any(token in filename for token in tokens):
+                return guessed_category
+
+        return "VARIOS"
+
+    def _category_from_extension(self, extension: str) -> Optional[str]:
+        """Categoría deducida solo de la extensión (mapa configurado y MIME)."""
         category = self.ext_to_categoria.get(extension)
         if category:
             return category
+        if not extension:
+            return None
 
-        guessed_type, _ = mimetypes.guess_type(str(file_path))
+        guessed_type, _ = mimetypes.guess_type(f"archivo{extension}")
         if guessed_type:
             top_level_type = guessed_type.split("/", 1)[0]
             if top_level_type == "audio":
@@ -493,42 +677,24 @@ class AnalysisWorker(QThread):
                 for token in ("pdf", "word", "sheet", "presentation", "json", "xml")
             ):
                 return "DOCUMENTOS"
+        return None
 
-        filename = file_path.name.lower()
-        token_map = {
-            "MUSICA": ("track", "album", "song", "mix", "audio"),
-            "VIDEOS": ("movie", "trailer", "video", "clip", "episode"),
-            "IMAGENES": ("img", "screenshot", "photo", "wallpaper", "camera"),
-            "DOCUMENTOS": (
-                "invoice",
-                "report",
-                "manual",
-                "doc",
-                "cv",
-                "resume",
-                "readme",
-            ),
-            "CODIGO": ("package", "docker", "config", "script", "source", "setup"),
-        }
-        for guessed_category, tokens in token_map.items():
-            if any(token in filename for token in tokens):
-                return guessed_category
-
-        return "VARIOS"
-
-    def is_excluded_path(self, path: Path) -> bool:
+    def is_excluded_path(self, path: Path | os.DirEntry) -> bool:
         """Determina si una ruta debe excluirse del análisis."""
-        normalized = str(path).lower()
+        normalized = os.fspath(path).lower()
         return any(
             normalized == ignored or normalized.startswith(f"{ignored}{os.sep}")
             for ignored in self.ignored_paths
         )
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        """Aplica exclusiones por ruta, extensión y tamaño mínimo."""
+    def _should_skip_file(self, file_path: Path | os.DirEntry) -> bool:
+        """Aplica exclusiones por ruta, extensión y tamaño mínimo.
+
+        Acepta también un DirEntry de os.scandir, cuyo stat() va en caché.
+        """
         if self.is_excluded_path(file_path):
             return True
-        if file_path.suffix.lower() in self.ignored_extensions:
+        if os.path.splitext(file_path.name)[1].lower() in self.ignored_extensions:
             return True
         if self.min_file_size_bytes <= 0:
             return False
@@ -543,24 +709,16 @@ class AnalysisWorker(QThread):
         """Calcula estadísticas generales del análisis"""
         total_folders = len(folder_movements)
         total_files = len(file_movements)
-        total_size = sum(
-            mov.get("size", 0) for mov in folder_movements + file_movements
-        )
+        total_size = 0
 
-        # Estadísticas por categoría
+        # Estadísticas por categoría (carpetas y archivos en una sola pasada)
         category_stats = defaultdict(lambda: {"count": 0, "size": 0})
-
-        # Contar carpetas por categoría
-        for mov in folder_movements:
-            category = mov["category"]
-            category_stats[category]["count"] += 1
-            category_stats[category]["size"] += mov.get("size", 0)
-
-        # Contar archivos por categoría
-        for mov in file_movements:
-            category = mov["category"]
-            category_stats[category]["count"] += 1
-            category_stats[category]["size"] += mov.get("size", 0)
+        for mov in chain(folder_movements, file_movements):
+            size = mov.get("size", 0)
+            total_size += size
+            stats = category_stats[mov["category"]]
+            stats["count"] += 1
+            stats["size"] += size
 
         return {
             "total_folders": total_folders,
@@ -574,6 +732,10 @@ class AnalysisWorker(QThread):
         self.is_running = False
 
 
+# Hilos para mover archivos sueltos en paralelo
+MOVE_WORKERS = 8
+
+
 class OrganizeWorker(QThread):
     """Worker para organizar archivos y carpetas en segundo plano
     🚀 MEJORADO: Con sistema de transacciones y rollback automático"""
@@ -598,10 +760,19 @@ class OrganizeWorker(QThread):
     ):
         super().__init__()
         self.source_folder = source_folder
+        self._source_root = Path(source_folder)
+        # Raíz de destino por categoría y carpetas ya creadas, para no rehacer
+        # Paths ni mkdir en cada elemento movido
+        self._dest_roots: Dict[str, Path] = {}
+        self._ensured_dirs = set()
+        # Nombres (en minúsculas) ya presentes en cada carpeta de destino: los
+        # conflictos se resuelven en memoria en lugar de con un stat por intento
+        self._dir_names: Dict[str, set] = {}
         self.folder_movements = folder_movements
         self.file_movements = file_movements
         self.is_running = True
         self.transaction_manager = TransactionManager()
+        self._progress = ProgressBuffer(self.progress_update.emit)
         self.current_transaction_id = None
         self.organize_by_date = organize_by_date
         self.check_duplicates = check_duplicates
@@ -634,7 +805,7 @@ class OrganizeWorker(QThread):
                 f"Organización de {total_items} elementos en {self.source_folder}"
             )
 
-            self.progress_update.emit(
+            self._progress.queue(
                 "🚀 Iniciando organización con protección de datos..."
             )
 
@@ -652,9 +823,11 @@ class OrganizeWorker(QThread):
             self.summary["duration_seconds"] = (
                 datetime.now() - started_at
             ).total_seconds()
+            self._progress.flush()
             self.summary_ready.emit(dict(self.summary))
 
-            self.progress_update.emit("✅ Organización completada exitosamente")
+            self._progress.queue("✅ Organización completada exitosamente")
+            self._progress.flush()
             self.organize_complete.emit(True, "Organización completada exitosamente")
 
             # Emitir señal de rollback disponible
@@ -662,11 +835,11 @@ class OrganizeWorker(QThread):
 
         except Exception as e:
             error_msg = f"❌ Error durante la organización: {str(e)}"
-            self.progress_update.emit(error_msg)
+            self._progress.queue(error_msg)
 
             # 🚀 MEJORA: Intentar rollback automático
             if self.current_transaction_id:
-                self.progress_update.emit("🔄 Intentando revertir cambios...")
+                self._progress.queue("🔄 Intentando revertir cambios...")
                 if self.transaction_manager.rollback_transaction(
                     self.current_transaction_id
                 ):
@@ -675,6 +848,7 @@ class OrganizeWorker(QThread):
                     error_msg += "\n⚠️ No se pudieron revertir todos los cambios"
 
             self.summary["errors"].append(error_msg)
+            self._progress.flush()
             self.summary_ready.emit(dict(self.summary))
             self.organize_complete.emit(False, error_msg)
 
@@ -682,24 +856,25 @@ class OrganizeWorker(QThread):
         """Crea la estructura de carpetas de destino solo si no existen"""
         try:
             # Crear carpeta VARIOS si no existe
-            varios_path = Path(self.source_folder) / VARIOS_FOLDER
-            if not varios_path.exists():
-                varios_path.mkdir(exist_ok=True)
-                self.progress_update.emit(f"📁 Creada carpeta: {VARIOS_FOLDER}")
+            try:
+                (self._source_root / VARIOS_FOLDER).mkdir()
+                self._progress.queue(f"📁 Creada carpeta: {VARIOS_FOLDER}")
+            except FileExistsError:
+                pass
 
             # Crear carpetas para cada categoría solo si no existen
-            categories = set()
-            for mov in self.folder_movements:
-                categories.add(mov["category"])
+            categories = {
+                mov["category"]
+                for mov in chain(self.folder_movements, self.file_movements)
+            }
             for mov in self.file_movements:
-                categories.add(mov["category"])
                 for candidate in self._build_destination_candidates(
                     mov.get("file"), mov["category"]
                 ):
-                    if candidate != Path(self.source_folder):
+                    if candidate != self._source_root:
                         try:
                             categories.add(
-                                str(candidate.relative_to(Path(self.source_folder)))
+                                str(candidate.relative_to(self._source_root))
                             )
                         except ValueError:
                             continue
@@ -707,32 +882,32 @@ class OrganizeWorker(QThread):
             created_folders = []
             existing_folders = []
 
-            for category in categories:
-                if category != "VARIOS":
-                    category_path = Path(self.source_folder) / category
-                    if not category_path.exists():
-                        category_path.mkdir(exist_ok=True)
-                        created_folders.append(category)
-                    else:
-                        existing_folders.append(category)
+            # Un único mkdir por carpeta: FileExistsError indica que ya existía.
+            # En orden para que las de año/mes queden tras su categoría
+            for category in sorted(categories - {"VARIOS"}):
+                try:
+                    (self._source_root / category).mkdir(parents=True)
+                    created_folders.append(category)
+                except FileExistsError:
+                    existing_folders.append(category)
 
             # Informar sobre carpetas creadas y existentes
             if created_folders:
                 self.summary["created_folders"].extend(created_folders)
-                self.progress_update.emit(
+                self._progress.queue(
                     f"📁 Carpetas creadas: {', '.join(created_folders)}"
                 )
             if existing_folders:
-                self.progress_update.emit(
+                self._progress.queue(
                     f"📁 Carpetas existentes (reutilizadas): {', '.join(existing_folders)}"
                 )
 
             if not created_folders and not existing_folders:
-                self.progress_update.emit("📁 No se requieren nuevas carpetas")
+                self._progress.queue("📁 No se requieren nuevas carpetas")
             elif not created_folders:
-                self.progress_update.emit("📁 Todas las carpetas ya existían")
+                self._progress.queue("📁 Todas las carpetas ya existían")
             elif not existing_folders:
-                self.progress_update.emit(
+                self._progress.queue(
                     "📁 Estructura de carpetas creada completamente"
                 )
 
@@ -751,128 +926,247 @@ class OrganizeWorker(QThread):
                 if self._is_protected_path(folder):
                     warning = f"Carpeta protegida omitida: {folder}"
                     self.summary["warnings"].append(warning)
-                    self.progress_update.emit(f"🛡️ {warning}")
+                    self._progress.queue(f"🛡️ {warning}")
                     continue
 
-                dest_path = build_base_destination(
-                    self.source_folder,
-                    category,
-                    folder.name,
-                    organize_by_date=False,
-                )
+                dest_path = self._dest_root(category) / folder.name
                 resolved = resolve_destination(
                     dest_path,
                     conflict_policy=self.conflict_policy,
                     is_folder=True,
+                    exists=self._name_taken,
                 )
                 dest_path = resolved.destination
                 if resolved.action == "skip":
                     warning = f"Carpeta omitida por conflicto: {folder.name}"
                     self.summary["warnings"].append(warning)
-                    self.progress_update.emit(f"⏭️ {warning}")
+                    self._progress.queue(f"⏭️ {warning}")
                     continue
 
                 # 🚀 MEJORA: Usar safe_move_file del transaction_manager
-                if self.transaction_manager.safe_move_file(folder, dest_path):
+                if self._move(folder, dest_path):
                     self.summary["folders_moved"] += 1
                     self.summary["bytes_reorganized"] += mov.get("size", 0)
                     progress = f"📁 Movida carpeta: {folder.name} → {category}"
-                    self.progress_update.emit(progress)
+                    self._progress.queue(progress)
                 else:
                     error = f"Error moviendo carpeta: {folder.name}"
                     self.summary["errors"].append(error)
-                    self.progress_update.emit(f"⚠️ {error}")
+                    self._progress.queue(f"⚠️ {error}")
 
         except Exception as e:
             raise Exception(f"Error moviendo carpetas: {str(e)}")
 
     def move_loose_files(self):
-        """Mueve los archivos sueltos a sus carpetas de destino"""
+        """Mueve los archivos sueltos a sus carpetas de destino
+
+        Primero se resuelven en serie los destinos (conflictos, sobrescrituras)
+        y después los movimientos se lanzan en paralelo.
+        """
         try:
-            for i, mov in enumerate(self.file_movements):
-                if not self.is_running:
-                    break
+            planned = self._plan_file_moves()
+            if planned:
+                self._run_file_moves(planned)
 
-                file = mov["file"]
-                category = mov["category"]
-                if self._is_protected_path(file):
-                    warning = f"Archivo protegido omitido: {file}"
-                    self.summary["warnings"].append(warning)
-                    self.progress_update.emit(f"🛡️ {warning}")
-                    continue
+        except Exception as e:
+            raise Exception(f"Error moviendo archivos: {str(e)}")
 
-                dest_path = self._resolve_file_destination(file, category)
-                resolved = resolve_destination(
-                    dest_path,
-                    conflict_policy=self.conflict_policy,
-                    is_folder=False,
+    def _plan_file_moves(self) -> List[tuple]:
+        """Resuelve el destino de cada archivo suelto reservando su nombre.
+
+        Returns:
+            Lista de (mov, archivo, destino, mensaje de progreso)
+        """
+        planned = []
+        for mov in self.file_movements:
+            if not self.is_running:
+                break
+
+            file = mov["file"]
+            category = mov["category"]
+            if self._is_protected_path(file):
+                warning = f"Archivo protegido omitido: {file}"
+                self.summary["warnings"].append(warning)
+                self._progress.queue(f"🛡️ {warning}")
+                continue
+
+            dest_path = self._resolve_file_destination(file, category)
+            resolved = resolve_destination(
+                dest_path,
+                conflict_policy=self.conflict_policy,
+                is_folder=False,
+                exists=self._name_taken,
+            )
+            dest_path = resolved.destination
+
+            # Resolver conflicto
+            if resolved.action == "skip":
+                self.summary["skipped_duplicates"] += 1
+                self._progress.queue(
+                    f"⏭️ Archivo omitido por conflicto: {file.name}"
                 )
-                dest_path = resolved.destination
+                continue
 
-                # Mover archivo
-                if resolved.action == "skip":
+            if resolved.action == "overwrite" and dest_path.exists():
+                if self.check_duplicates and self._is_duplicate_file(
+                    file, dest_path
+                ):
                     self.summary["skipped_duplicates"] += 1
-                    self.progress_update.emit(
-                        f"⏭️ Archivo omitido por conflicto: {file.name}"
+                    self._progress.queue(
+                        f"⏭️ Duplicado omitido: {file.name} ya existe en {dest_path.parent}"
                     )
                     continue
+                backup_path = find_available_name(
+                    dest_path.with_name(f".{dest_path.stem}.overwrite{dest_path.suffix}"),
+                    self._name_taken,
+                )
+                if not self._move(dest_path, backup_path):
+                    error = f"Error preparando sobrescritura: {dest_path.name}"
+                    self.summary["errors"].append(error)
+                    self._progress.queue(f"⚠️ {error}")
+                    continue
 
-                if dest_path.exists() and resolved.action == "overwrite":
-                    if self.check_duplicates and self._is_duplicate_file(
-                        file, dest_path
-                    ):
-                        self.summary["skipped_duplicates"] += 1
-                        self.progress_update.emit(
-                            f"⏭️ Duplicado omitido: {file.name} ya existe en {dest_path.parent}"
-                        )
-                        continue
-                    backup_path = find_available_name(
-                        dest_path.with_name(f".{dest_path.stem}.overwrite{dest_path.suffix}")
-                    )
-                    if not self.transaction_manager.safe_move_file(dest_path, backup_path):
-                        error = f"Error preparando sobrescritura: {dest_path.name}"
-                        self.summary["errors"].append(error)
-                        self.progress_update.emit(f"⚠️ {error}")
-                        continue
+            elif self._name_taken(dest_path):
+                dest_path = find_available_name(dest_path, self._name_taken)
 
-                elif dest_path.exists():
-                    dest_path = find_available_name(dest_path)
+            # Reservar el nombre: los movimientos aún no se han hecho y
+            # otro archivo del lote podría resolver al mismo destino
+            self._reserve_name(dest_path)
 
-                # Mostrar información sobre la carpeta de destino
-                dest_folder = dest_path.parent.name
-                if dest_folder == category:
-                    progress = f"📄 Movido archivo: {file.name} → {category}/"
-                else:
-                    progress = f"📄 Movido archivo: {file.name} → {dest_folder}/"
+            # Mostrar información sobre la carpeta de destino
+            dest_folder = dest_path.parent.name
+            if dest_folder == category:
+                progress = f"📄 Movido archivo: {file.name} → {category}/"
+            else:
+                progress = f"📄 Movido archivo: {file.name} → {dest_folder}/"
 
-                # 🚀 MEJORA: Usar safe_move_file del transaction_manager
-                if self.transaction_manager.safe_move_file(file, dest_path):
-                    self.summary["files_moved"] += 1
-                    self.summary["bytes_reorganized"] += mov.get("size", 0)
-                    self.progress_update.emit(progress)
-                else:
-                    error = f"Error moviendo archivo: {file.name}"
-                    self.summary["errors"].append(error)
-                    self.progress_update.emit(f"⚠️ {error}")
+            planned.append((mov, file, dest_path, progress))
 
-        except Exception as e:
-            raise Exception(f"Error moviendo archivos: {str(e)}")
+        return planned
+
+    def _run_file_moves(self, planned: List[tuple]):
+        """Ejecuta los movimientos planificados con un pool de hilos.
+
+        Mover es sobre todo latencia de E/S (sobre todo entre volúmenes o en
+        red); los resultados se recogen en orden en el QThread, que es el único
+        que toca summary y las señales.
+        """
+        move = self.transaction_manager.safe_move_file
+        executor = ThreadPoolExecutor(
+            max_workers=min(MOVE_WORKERS, len(planned)), thread_name_prefix="organize"
+        )
+        futures = []
+        handled = 0
+        try:
+            futures = [
+                executor.submit(move, os.fspath(file), os.fspath(dest_path))
+                for _, file, dest_path, _ in planned
+            ]
+            for (mov, file, _, progress), future in zip(planned, futures):
+                if not self.is_running:
+                    break
+                # 🚀 MEJORA: Usar safe_move_file del transaction_manager
+                self._record_move_result(mov, file, progress, future.result())
+                handled += 1
+        finally:
+            # Los movimientos no iniciados se cancelan; los que están en curso
+            # terminan y quedan registrados para un posible rollback
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Tras una parada, los movimientos que ya estaban en curso se han
+        # completado igualmente: se cuentan para que el resumen refleje el disco
+        for (mov, file, _, progress), future in zip(
+            planned[handled:], futures[handled:]
+        ):
+            if not future.cancelled():
+                self._record_move_result(mov, file, progress, future.result())
+
+    def _record_move_result(
+        self, mov: Dict[str, Any], file: Path, progress: str, moved: bool
+    ):
+        """Suma al resumen el resultado de un movimiento planificado"""
+        if moved:
+            self.summary["files_moved"] += 1
+            self.summary["bytes_reorganized"] += mov.get("size", 0)
+            self._progress.queue(progress)
+        else:
+            error = f"Error moviendo archivo: {file.name}"
+            self.summary["errors"].append(error)
+            self._progress.queue(f"⚠️ {error}")
 
     def stop(self):
         """Detiene el worker"""
         self.is_running = False
 
+    def _names_in(self, directory: str) -> Optional[set]:
+        """Nombres presentes en una carpeta, leídos una sola vez con scandir.
+
+        Devuelve None si la carpeta no se puede listar.
+        """
+        names = self._dir_names.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name.lower() for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            except OSError:
+                return None
+            self._dir_names[directory] = names
+        return names
+
+    def _name_taken(self, path: Path) -> bool:
+        """Equivalente en memoria de path.exists() para los destinos.
+
+        Se compara sin distinguir mayúsculas: en sistemas que sí distinguen,
+        como mucho se renombra de más, nunca se sobrescribe.
+        """
+        directory, name = os.path.split(os.fspath(path))
+        names = self._names_in(directory)
+        if names is None:
+            return os.path.exists(path)
+        return name.lower() in names
+
+    def _reserve_name(self, path: Path):
+        """Marca un nombre de destino como ocupado en el índice en memoria."""
+        directory, name = os.path.split(os.fspath(path))
+        names = self._dir_names.get(directory)
+        if names is not None:
+            names.add(name.lower())
+
+    def _move(self, source: Path, destination: Path) -> bool:
+        """Mueve con el transaction_manager y mantiene el índice de nombres."""
+        if not self.transaction_manager.safe_move_file(
+            os.fspath(source), os.fspath(destination)
+        ):
+            return False
+        # El origen no se retira del índice: con nombres en minúsculas podría
+        # liberar otro archivo que solo difiere en mayúsculas
+        self._reserve_name(destination)
+        return True
+
+    def _dest_root(self, category: str) -> Path:
+        """Carpeta de destino de una categoría (misma ruta que build_base_destination)."""
+        root = self._dest_roots.get(category)
+        if root is None:
+            root = self._dest_roots[category] = self._source_root / category
+        return root
+
     def _resolve_file_destination(self, file_path: Path, category: str) -> Path:
         """Construye el destino final del archivo respetando organización por fecha."""
-        modified = datetime.fromtimestamp(file_path.stat().st_mtime) if self.organize_by_date else None
-        base_dir = build_base_destination(
-            self.source_folder,
-            category,
-            file_path.name,
-            organize_by_date=self.organize_by_date,
-            modified_at=modified.timestamp() if modified else None,
-        ).parent
-        base_dir.mkdir(parents=True, exist_ok=True)
+        if self.organize_by_date:
+            base_dir = build_base_destination(
+                self.source_folder,
+                category,
+                file_path.name,
+                organize_by_date=True,
+                modified_at=file_path.stat().st_mtime,
+            ).parent
+        else:
+            base_dir = self._dest_root(category)
+        if base_dir not in self._ensured_dirs:
+            base_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(base_dir)
         return base_dir / file_path.name
 
     def _build_destination_candidates(
@@ -880,9 +1174,9 @@ class OrganizeWorker(QThread):
     ) -> List[Path]:
         """Retorna carpetas potenciales de destino para pre-crear estructura."""
         if category == "VARIOS":
-            base_dir = Path(self.source_folder) / VARIOS_FOLDER
+            base_dir = self._source_root / VARIOS_FOLDER
         else:
-            base_dir = Path(self.source_folder) / category
+            base_dir = self._dest_root(category)
         if not file_path or not self.organize_by_date:
             return [base_dir]
         modified = datetime.fromtimestamp(file_path.stat().st_mtime)
@@ -901,7 +1195,7 @@ class OrganizeWorker(QThread):
             dest_hash = self.hash_manager.calculate_file_hash(destination, "md5")
             return bool(source_hash and source_hash == dest_hash)
         except Exception as error:
-            self.progress_update.emit(
+            self._progress.queue(
                 f"⚠️ No se pudo verificar duplicado para {source.name}: {error}"
             )
             return False
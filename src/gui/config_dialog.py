@@ -5,6 +5,7 @@ Maneja la gestión de categorías y extensiones
 """
 
 import os
+from bisect import bisect_left
 from typing import Dict, List, Optional
 from pathlib import Path
 
@@ -35,11 +36,97 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
 
+from src.utils.app_config import AppConfig
 from src.utils.constants import COLORS, DIALOG_STYLES
+from src.utils.logger import debug, error
+from src.utils.themes import ThemeManager
 from src.core.category_manager import CategoryManager
 from src.gui.rule_panel import RulePanel
 
 
+# Opciones del combo de tamaño de fuente: (texto, tamaño en píxeles)
+_FONT_SIZES = (
+    ("Pequeño (10px)", 10),
+    ("Normal (12px) - Por defecto", 12),
+    ("Grande (14px)", 14),
+    ("Muy Grande (16px)", 16),
+)
+# Descripción por tramo: <=10, <=12, <=14 y el resto
+_FONT_SIZE_LIMITS = (10, 12, 14)
+_FONT_SIZE_DESCRIPTIONS = ("Pequeño", "Normal (Por defecto)", "Grande", "Muy Grande")
+
+# Tooltips de las filas de categoría
+_SYSTEM_CATEGORY_TIP = "📁 Categoría del sistema (no se puede eliminar)"
+_CUSTOM_CATEGORY_TIP = "📁 Categoría personalizada (se puede eliminar)"
+
+
+def _build_dialog_css(theme: str, font_size: int) -> str:
+    """Hoja de estilos completa del diálogo para un tema y tamaño de fuente.
+
+    Colores y CSS base salen de ThemeCache a través de ThemeManager; aquí solo
+    se concatenan, así que no se cachea aparte (ThemeCache.clear() no podría
+    invalidar una segunda caché).
+    """
+    colors = ThemeManager.get_theme_colors(theme)
+    css_styles = ThemeManager.get_css_styles(theme, font_size)
+
+    # Estilos propios de título, stats y listas con selectores por
+    # objectName: así todo va en una sola hoja sobre el diálogo y los
+    # hijos la heredan, sin re-estilizar cada widget por separado
+    dialog_css = f"""
+        QLabel#config_title_label {{
+            font-size: 18px;
+            font-weight: bold;
+            color: {colors["text_primary"]} !important;
+            padding: 15px;
+            text-align: center;
+            background-color: {colors["surface"]} !important;
+            border-radius: 8px;
+            margin-bottom: 10px;
+        }}
+        QLabel#config_stats_label {{
+            color: {colors["text_secondary"]} !important;
+            font-size: 12px;
+            padding: 8px;
+            text-align: center;
+            background-color: {colors["surface"]} !important;
+            border-radius: 6px;
+            border: 1px solid {colors["border"]} !important;
+        }}
+        QLabel#config_status_label {{
+            color: {colors.get("success", colors["primary"])};
+            font-weight: bold;
+            padding: 0 8px;
+        }}
+        QListWidget#categories_list,
+        QListWidget#extensions_list {{
+            background-color: {colors["surface"]} !important;
+            color: {colors["text_primary"]} !important;
+            border: 1px solid {colors["border"]} !important;
+            border-radius: 8px;
+            padding: 4px;
+        }}
+        QListWidget#categories_list::item,
+        QListWidget#extensions_list::item {{
+            background-color: {colors["surface"]} !important;
+            color: {colors["text_primary"]} !important;
+            padding: 6px;
+            border-radius: 4px;
+        }}
+        QListWidget#categories_list::item:selected,
+        QListWidget#extensions_list::item:selected {{
+            background-color: {colors["primary"]} !important;
+            color: white !important;
+        }}
+        QListWidget#categories_list::item:hover,
+        QListWidget#extensions_list::item:hover {{
+            background-color: {colors.get("button_hover", colors["secondary"])} !important;
+            color: white !important;
+        }}
+    """
+    return css_styles + dialog_css
+
+
 class ConfigDialog(QDialog):
     """Ventana de configuración para gestionar categorías y extensiones"""
 
@@ -56,36 +143,92 @@ class ConfigDialog(QDialog):
     ):
         super().__init__(parent)
         self.category_manager = category_manager or CategoryManager()
+        # Nombres mostrados en las listas, en el mismo orden que sus filas,
+        # para altas y bajas incrementales sin reconstruir la lista
+        self._category_names: List[str] = []
+        self._category_items: Dict[str, QListWidgetItem] = {}
+        self._extension_names: List[str] = []
+        # Categoría cuyas extensiones se muestran ahora mismo
+        self._last_selected_category: str | None = None
+        # Las categorías del sistema son fijas: se consultan como conjunto
+        self._system_categories = frozenset(
+            self.category_manager.get_system_categories()
+        )
         self.app_config = app_config_ref or self._build_app_config()
         self.focus_section = focus_section
+        # La interfaz se construye al mostrarse por primera vez
+        self._initialized = False
+        # Colores del tema resueltos para esta sesión del diálogo; se
+        # invalidan al aplicar cambios de interfaz
+        self._theme_cache: tuple[str, dict] | None = None
+        self._qcolor_cache: Dict[str, QColor] = {}
+        # Caja de confirmación de "Aplicar Cambios", creada al primer uso
+        self._info_mbox: QMessageBox | None = None
+        # Tema con cuyos colores se construyeron las filas de las listas
+        self._lists_theme: str | None = None
+        # (tema, tamaño de fuente) aplicados por última vez al diálogo
+        self._applied_theme: tuple[str, int] | None = None
+        # Las peticiones de tema seguidas se agrupan en una sola aplicación
+        # por vuelta del bucle de eventos
+        self._apply_pending = QTimer(self)
+        self._apply_pending.setSingleShot(True)
+        self._apply_pending.setInterval(0)
+        self._apply_pending.timeout.connect(self._do_apply_theme)
+
+    def _ensure_initialized(self):
+        """Construye la interfaz y carga los datos la primera vez que se necesita"""
+        if self._initialized:
+            return
+        self._initialized = True
         self.init_ui()
         # Cargar tema actual en el combo box
         self._load_current_theme()
         self.refresh_categories_list()
         self.load_exclusions()
         self.update_stats()
-        # Aplicar tema inicial
-        self.apply_current_theme_to_self()
+        # Aplicar tema inicial ya, antes de que se pinte la primera vez
+        self._do_apply_theme()
         if self.focus_section == "exclusions":
             QTimer.singleShot(0, self.focus_exclusions_section)
 
-    def _build_app_config(self):
-        from src.utils.app_config import AppConfig
+    def setVisible(self, visible: bool):
+        """Construye la interfaz antes de mostrarse.
 
+        Se hace aquí y no en showEvent: los hijos creados en showEvent no se
+        mostrarían, porque Qt ya ha recorrido los hijos para entonces.
+        """
+        if visible:
+            self._ensure_initialized()
+        super().setVisible(visible)
+
+    def _build_app_config(self):
         return AppConfig()
 
     def _load_current_theme(self):
-        """Carga el tema actual en el combo box"""
+        """Carga los temas en el combo box y selecciona el actual"""
         try:
-            current_theme = self.app_config.get_theme()
-            if hasattr(self, "theme_combo") and self.theme_combo:
-                # Buscar el índice del tema actual
-                for i in range(self.theme_combo.count()):
-                    if self.theme_combo.itemText(i) == current_theme:
-                        self.theme_combo.setCurrentIndex(i)
-                        break
-        except:
-            pass
+            self._populate_theme_combo_once()
+            index = self._theme_index.get(self.app_config.get_theme())
+            if index is not None:
+                self.theme_combo.setCurrentIndex(index)
+        except (AttributeError, TypeError) as e:
+            # Tema guardado con un valor no válido (p. ej. no hashable): se
+            # queda el primero
+            debug(f"No se pudo seleccionar el tema guardado: {e}")
+
+    def _populate_theme_combo_once(self):
+        """Rellena el combo de temas la primera vez que se necesita"""
+        if self._theme_combo_populated:
+            return
+        self._theme_combo_populated = True
+        theme_names = ThemeManager.get_theme_names()
+        # Índice de cada tema en el combo, para seleccionarlo sin recorrerlo
+        self._theme_index = {name: i for i, name in enumerate(theme_names)}
+        self.theme_combo.blockSignals(True)
+        try:
+            self.theme_combo.addItems(theme_names)
+        finally:
+            self.theme_combo.blockSignals(False)
 
     def init_ui(self):
         """Inicializa la interfaz del diálogo"""
@@ -110,6 +253,14 @@ class ConfigDialog(QDialog):
         self.stats_label.setObjectName("config_stats_label")
         layout.addWidget(self.stats_label)
 
+        # Confirmaciones breves en línea en lugar de un QMessageBox modal
+        self._status_label = QLabel()
+        self._status_label.setObjectName("config_status_label")
+        layout.addWidget(self._status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._status_label.clear)
+
         sections = QTabWidget()
         sections.setObjectName("config_sections_tabs")
 
@@ -137,24 +288,19 @@ class ConfigDialog(QDialog):
         font_size_label = QLabel("📝 Tamaño de fuente:")
         interface_layout.addWidget(font_size_label, 0, 0)
         self.font_size_combo = QComboBox()
-        self.font_size_combo.addItems(
-            [
-                "Pequeño (10px)",
-                "Normal (12px) - Por defecto",
-                "Grande (14px)",
-                "Muy Grande (16px)",
-            ]
-        )
+        # El tamaño en píxeles va como dato de cada opción
+        for label, size in _FONT_SIZES:
+            self.font_size_combo.addItem(label, size)
         self.font_size_combo.setCurrentIndex(1)
         self.font_size_combo.currentTextChanged.connect(self.on_font_size_changed)
         interface_layout.addWidget(self.font_size_combo, 0, 1)
 
         theme_label = QLabel("🌈 Tema de color:")
         interface_layout.addWidget(theme_label, 1, 0)
-        from src.utils.themes import ThemeManager
-
+        # Se rellena en _load_current_theme, junto con el tema seleccionado
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(ThemeManager.get_theme_names())
+        self._theme_combo_populated = False
+        self._theme_index: Dict[str, int] = {}
         self.theme_combo.currentTextChanged.connect(self.on_theme_changed)
         interface_layout.addWidget(self.theme_combo, 1, 1)
 
@@ -243,6 +389,9 @@ class ConfigDialog(QDialog):
         )
         categories_layout = QVBoxLayout(categories_group)
         self.categories_list = QListWidget()
+        self.categories_list.setObjectName("categories_list")
+        # Todas las filas son de una línea: Qt mide una sola vez su altura
+        self.categories_list.setUniformItemSizes(True)
         self.categories_list.itemClicked.connect(self.on_category_selected)
         self.categories_list.setMinimumHeight(160)
         categories_layout.addWidget(self.categories_list)
@@ -272,6 +421,8 @@ class ConfigDialog(QDialog):
         )
         extensions_layout = QVBoxLayout(extensions_group)
         self.extensions_list = QListWidget()
+        self.extensions_list.setObjectName("extensions_list")
+        self.extensions_list.setUniformItemSizes(True)
         self.extensions_list.setMinimumHeight(160)
         extensions_layout.addWidget(self.extensions_list)
 
@@ -406,33 +557,92 @@ class ConfigDialog(QDialog):
         self.add_ext_btn.setEnabled(False)
         self.remove_ext_btn.setEnabled(False)
 
-    def refresh_categories_list(self):
-        """Actualiza la lista de categorías"""
-        self.categories_list.clear()
-
-        # Obtener colores del tema actual (no hardcodeados)
-        from src.utils.themes import ThemeManager
-
+    def _get_theme_colors(self) -> dict:
+        """Colores del tema actual, resueltos una vez por tema"""
         theme = self.app_config.get_theme()
-        colors = ThemeManager.get_theme_colors(theme)
-
-        # Obtener categorías del gestor
-        categories = self.category_manager.get_categories()
-
-        for category_name in sorted(categories.keys()):
-            item = QListWidgetItem(category_name)
-
-            # Marcar categorías del sistema con color del tema
-            if self.category_manager.is_system_category(category_name):
-                # Usar color del tema en lugar de hardcodeado
-                item.setBackground(QColor(colors.get("accent", colors["primary"])))
-                item.setForeground(QColor(colors["text_primary"]))
-                item.setToolTip("📁 Categoría del sistema (no se puede eliminar)")
-            else:
-                item.setForeground(QColor(colors["text_primary"]))
-                item.setToolTip("📁 Categoría personalizada (se puede eliminar)")
-
-            self.categories_list.addItem(item)
+        if self._theme_cache is None or self._theme_cache[0] != theme:
+            self._theme_cache = (theme, ThemeManager.get_theme_colors(theme))
+            self._qcolor_cache.clear()
+        return self._theme_cache[1]
+
+    def _get_theme_qcolor(self, key: str) -> QColor:
+        """QColor de un color del tema (accent cae en primary si no existe)"""
+        colors = self._get_theme_colors()
+        color = self._qcolor_cache.get(key)
+        if color is None:
+            color = self._qcolor_cache[key] = QColor(colors.get(key, colors["primary"]))
+        return color
+
+    def _invalidate_theme_cache(self):
+        """Descarta los colores cacheados tras un cambio de tema"""
+        self._theme_cache = None
+        self._qcolor_cache.clear()
+
+    def refresh_categories_list(self, reload_names: bool = True):
+        """Actualiza la lista de categorías
+
+        Solo se quitan e insertan las filas que cambian; las que siguen se
+        conservan (con su selección) y se recolorean si cambió el tema.
+
+        Args:
+            reload_names: Si es False se reutilizan los nombres ya ordenados
+                (solo cambian los colores, p. ej. al aplicar un tema)
+        """
+        # Obtener colores del tema actual (no hardcodeados), una sola vez
+        fg = self._get_theme_qcolor("text_primary")
+        accent = self._get_theme_qcolor("accent")
+        theme = self._theme_cache[0]
+        recolor = self._lists_theme != theme
+        self._lists_theme = theme
+
+        # Obtener categorías del gestor; add/remove mantienen la lista ordenada
+        if reload_names:
+            self._category_names = sorted(self.category_manager.get_categories())
+        # Atributos usados en cada vuelta, resueltos una sola vez
+        items = self._category_items
+        make_item = self._make_category_item
+        color_item = self._color_category_item
+
+        # Actualizar sin repintar ni emitir señales por cada elemento
+        lst = self.categories_list
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            names = set(self._category_names)
+            for name in [name for name in items if name not in names]:
+                lst.takeItem(lst.row(items.pop(name)))
+            # Las filas que quedan siguen ordenadas: cada nombre nuevo se
+            # inserta en la misma posición que ocupa en la lista ordenada
+            for row, category_name in enumerate(self._category_names):
+                item = items.get(category_name)
+                if item is None:
+                    item = items[category_name] = make_item(category_name, fg, accent)
+                    lst.insertItem(row, item)
+                elif recolor:
+                    color_item(item, fg, accent)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+
+    def _make_category_item(
+        self, category_name: str, fg: QColor, accent: QColor
+    ) -> QListWidgetItem:
+        """Crea el elemento de lista de una categoría con los colores del tema"""
+        item = QListWidgetItem(category_name)
+        if category_name in self._system_categories:
+            item.setToolTip(_SYSTEM_CATEGORY_TIP)
+        else:
+            item.setToolTip(_CUSTOM_CATEGORY_TIP)
+        self._color_category_item(item, fg, accent)
+        return item
+
+    def _color_category_item(self, item: QListWidgetItem, fg: QColor, accent: QColor):
+        """Aplica los colores del tema a la fila de una categoría"""
+        # Marcar categorías del sistema con color del tema
+        if item.text() in self._system_categories:
+            # Usar color del tema en lugar de hardcodeado
+            item.setBackground(accent)
+        item.setForeground(fg)
 
     def on_category_selected(self, item):
         """Maneja la selección de una categoría"""
@@ -440,30 +650,39 @@ class ConfigDialog(QDialog):
             return
 
         category_name = item.text()
-        self.refresh_extensions_list(category_name)
+        # Volver a pulsar la fila ya seleccionada no reconstruye la lista
+        if category_name != self._last_selected_category:
+            self.refresh_extensions_list(category_name)
 
         # Habilitar/deshabilitar botones según el tipo de categoría
-        is_system = self.category_manager.is_system_category(category_name)
+        is_system = category_name in self._system_categories
         self.remove_cat_btn.setEnabled(not is_system)
         self.add_ext_btn.setEnabled(True)
         self.remove_ext_btn.setEnabled(True)
 
     def refresh_extensions_list(self, category_name: str):
         """Actualiza la lista de extensiones de una categoría"""
-        self.extensions_list.clear()
-
+        self._last_selected_category = category_name
         # Obtener colores del tema actual
-        from src.utils.themes import ThemeManager
-
-        theme = self.app_config.get_theme()
-        colors = ThemeManager.get_theme_colors(theme)
+        fg = self._get_theme_qcolor("text_primary")
 
         extensions = self.category_manager.get_extensions_for_category(category_name)
+        self._extension_names = sorted(extensions)
+        new_item = QListWidgetItem
 
-        for extension in sorted(extensions):
-            item = QListWidgetItem(extension)
-            item.setForeground(QColor(colors["text_primary"]))
-            self.extensions_list.addItem(item)
+        lst = self.extensions_list
+        add_item = lst.addItem
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.clear()
+            for extension in self._extension_names:
+                item = new_item(extension)
+                item.setForeground(fg)
+                add_item(item)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
 
     def add_category(self):
         """Añade una nueva categoría"""
@@ -482,11 +701,17 @@ class ConfigDialog(QDialog):
 
             # Añadir categoría vacía
             if self.category_manager.add_category(name, []):
-                self.refresh_categories_list()
-                self.update_stats()
-                QMessageBox.information(
-                    self, "Éxito", f"Categoría '{name}' creada exitosamente."
+                # Insertar solo la nueva fila en su posición ordenada
+                row = bisect_left(self._category_names, name)
+                self._category_names.insert(row, name)
+                item = self._category_items[name] = self._make_category_item(
+                    name,
+                    self._get_theme_qcolor("text_primary"),
+                    self._get_theme_qcolor("accent"),
                 )
+                self.categories_list.insertItem(row, item)
+                self.update_stats()
+                self._flash_status(f"✅ Categoría '{name}' creada exitosamente.")
             else:
                 QMessageBox.critical(self, "Error", "No se pudo crear la categoría.")
 
@@ -498,7 +723,7 @@ class ConfigDialog(QDialog):
 
         category_name = current_item.text()
 
-        if self.category_manager.is_system_category(category_name):
+        if category_name in self._system_categories:
             QMessageBox.warning(
                 self, "Advertencia", "No se pueden eliminar categorías del sistema."
             )
@@ -514,13 +739,19 @@ class ConfigDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             if self.category_manager.remove_category(category_name):
-                self.refresh_categories_list()
+                row = self.categories_list.row(current_item)
+                self.categories_list.takeItem(row)
+                del self._category_names[row]
+                del self._category_items[category_name]
+                # Sin selección, como tras reconstruir la lista: las
+                # extensiones mostradas ya no corresponden a ninguna fila
+                self.categories_list.setCurrentItem(None)
                 self.extensions_list.clear()
+                self._extension_names = []
+                self._last_selected_category = None
                 self.update_stats()
-                QMessageBox.information(
-                    self,
-                    "Éxito",
-                    f"Categoría '{category_name}' eliminada exitosamente.",
+                self._flash_status(
+                    f"✅ Categoría '{category_name}' eliminada exitosamente."
                 )
             else:
                 QMessageBox.critical(self, "Error", "No se pudo eliminar la categoría.")
@@ -567,11 +798,18 @@ class ConfigDialog(QDialog):
             if self.category_manager.add_extension_to_category(
                 category_name, extension
             ):
-                self.refresh_extensions_list(category_name)
+                if category_name != self._last_selected_category:
+                    # La selección cambió con el teclado sin pasar por
+                    # itemClicked: la lista visible es de otra categoría
+                    self.refresh_extensions_list(category_name)
+                else:
+                    row = bisect_left(self._extension_names, extension)
+                    self._extension_names.insert(row, extension)
+                    item = QListWidgetItem(extension)
+                    item.setForeground(self._get_theme_qcolor("text_primary"))
+                    self.extensions_list.insertItem(row, item)
                 self.update_stats()
-                QMessageBox.information(
-                    self, "Éxito", f"Extensión '{extension}' añadida exitosamente."
-                )
+                self._flash_status(f"✅ Extensión '{extension}' añadida exitosamente.")
             else:
                 QMessageBox.critical(self, "Error", "No se pudo añadir la extensión.")
 
@@ -598,10 +836,16 @@ class ConfigDialog(QDialog):
             if self.category_manager.remove_extension_from_category(
                 category_name, extension
             ):
-                self.refresh_extensions_list(category_name)
+                if category_name != self._last_selected_category:
+                    # La lista visible es de otra categoría: se reconstruye
+                    self.refresh_extensions_list(category_name)
+                else:
+                    row = self.extensions_list.row(current_ext_item)
+                    self.extensions_list.takeItem(row)
+                    del self._extension_names[row]
                 self.update_stats()
-                QMessageBox.information(
-                    self, "Éxito", f"Extensión '{extension}' eliminada exitosamente."
+                self._flash_status(
+                    f"✅ Extensión '{extension}' eliminada exitosamente."
                 )
             else:
                 QMessageBox.critical(self, "Error", "No se pudo eliminar la extensión.")
@@ -617,9 +861,7 @@ class ConfigDialog(QDialog):
 
         if filepath:
             if self.category_manager.export_to_txt(filepath):
-                QMessageBox.information(
-                    self, "Éxito", f"Categorías exportadas exitosamente a:\n{filepath}"
-                )
+                self._flash_status(f"✅ Categorías exportadas exitosamente a: {filepath}")
             else:
                 QMessageBox.critical(
                     self, "Error", "No se pudo exportar las categorías."
@@ -638,11 +880,18 @@ class ConfigDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             self.category_manager.reset_to_default()
             self.refresh_categories_list()
+            self.categories_list.setCurrentItem(None)
             self.extensions_list.clear()
+            self._extension_names = []
+            self._last_selected_category = None
             self.update_stats()
-            QMessageBox.information(
-                self, "Éxito", "Categorías restauradas por defecto exitosamente."
-            )
+            self._flash_status("✅ Categorías restauradas por defecto exitosamente.")
+
+    def _flash_status(self, text: str):
+        """Muestra una confirmación en línea durante unos segundos"""
+        self._status_label.setText(text)
+        # Reiniciar el temporizador: un mensaje nuevo no se borra antes de tiempo
+        self._status_timer.start(2500)
 
     def update_stats(self):
         """Actualiza las estadísticas mostradas"""
@@ -657,6 +906,7 @@ class ConfigDialog(QDialog):
 
     def accept(self):
         """Maneja la aceptación del diálogo"""
+        self._ensure_initialized()
         self.save_exclusions()
         self.app_config.set_audio_settings(
             {
@@ -710,6 +960,7 @@ class ConfigDialog(QDialog):
 
     def get_updated_categories(self) -> Dict[str, List[str]]:
         """Retorna las categorías actualizadas"""
+        self._ensure_initialized()
         return self.category_manager.get_categories()
 
     def open_rules_panel(self):
@@ -737,40 +988,36 @@ class ConfigDialog(QDialog):
         try:
             # Obtener valores actuales
             font_size = self.get_font_size_from_combo()
+            self._populate_theme_combo_once()
             theme_text = self.theme_combo.currentText()
 
             # Guardar configuración PRIMERO
             self.app_config.set_font_size(font_size)
             self.app_config.set_theme(theme_text)
+            self._invalidate_theme_cache()
 
             # Emitir señal para aplicar cambios INMEDIATAMENTE
             self.interface_changes_requested.emit(font_size, theme_text)
 
-            # Aplicar el tema a este mismo diálogo inmediatamente (después de guardar)
-            # Usar QTimer para asegurar que se aplica después de que se procesen los eventos
-            from PyQt6.QtCore import QTimer
-
-            QTimer.singleShot(50, self.apply_current_theme_to_self)
-
-            # Crear el mensaje con el tema aplicado
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle("✅ Cambios Aplicados INMEDIATAMENTE")
-            msg_box.setText(
+            # Aplicar el tema a este mismo diálogo una sola vez: se agrupa con
+            # la petición que hace la ventana principal al recibir la señal
+            self.apply_current_theme_to_self()
+
+            # Mensaje con el tema aplicado: se reutiliza la misma caja y la hoja
+            # de estilos le llega del diálogo; la paleta no se hereda en
+            # ventanas, así que se asigna (va en caché en ThemeManager)
+            if self._info_mbox is None:
+                self._info_mbox = QMessageBox(self)
+                self._info_mbox.setWindowTitle("✅ Cambios Aplicados INMEDIATAMENTE")
+                self._info_mbox.setIcon(QMessageBox.Icon.Information)
+            self._info_mbox.setText(
                 f"🎨 Tema: {theme_text}\n"
                 f"📝 Tamaño: {self.get_font_size_description(font_size)}\n\n"
                 f"Los cambios se han aplicado INMEDIATAMENTE a toda la aplicación."
             )
-            msg_box.setIcon(QMessageBox.Icon.Information)
+            self._info_mbox.setPalette(ThemeManager.apply_theme_to_palette(theme_text))
 
-            # Aplicar el tema actual al QMessageBox
-            from src.utils.themes import ThemeManager
-
-            theme_palette = ThemeManager.apply_theme_to_palette(theme_text)
-            theme_css = ThemeManager.get_css_styles(theme_text, font_size)
-            msg_box.setPalette(theme_palette)
-            msg_box.setStyleSheet(theme_css)
-
-            msg_box.exec()
+            self._info_mbox.exec()
 
         except Exception as e:
             QMessageBox.critical(
@@ -779,186 +1026,57 @@ class ConfigDialog(QDialog):
 
     def get_font_size_from_combo(self) -> int:
         """Obtiene el tamaño de fuente en píxeles desde el combo"""
-        current_text = self.font_size_combo.currentText()
-        if "Pequeño" in current_text:
-            return 10
-        elif "Normal" in current_text:
-            return 12
-        elif "Grande" in current_text:
-            return 14
-        elif "Muy Grande" in current_text:
-            return 16
-        else:
-            return 12  # Por defecto
+        return self.font_size_combo.currentData() or 12  # Por defecto
 
     def get_font_size_description(self, size: int) -> str:
         """Convierte el tamaño de fuente a descripción legible"""
-        if size <= 10:
-            return "Pequeño"
-        elif size <= 12:
-            return "Normal (Por defecto)"
-        elif size <= 14:
-            return "Grande"
-        else:
-            return "Muy Grande"
+        return _FONT_SIZE_DESCRIPTIONS[bisect_left(_FONT_SIZE_LIMITS, size)]
 
     def apply_current_theme_to_self(self):
+        """Programa la aplicación del tema actual a este mismo diálogo
+
+        Varias llamadas seguidas se resuelven en una sola aplicación en la
+        siguiente vuelta del bucle de eventos.
+        """
+        if not self._initialized:
+            # Se aplicará al construir la interfaz
+            return
+        self._apply_pending.start()
+
+    def _do_apply_theme(self):
         """Aplica el tema actual a este mismo diálogo usando el sistema mejorado"""
+        self._apply_pending.stop()
         try:
-            from src.utils.themes import ThemeManager
-            from PyQt6.QtWidgets import (
-                QWidget,
-                QGroupBox,
-                QComboBox,
-                QPushButton,
-                QLabel,
-            )
-
             theme = self.app_config.get_theme()
             font_size = self.app_config.get_font_size()
+            if self._applied_theme == (theme, font_size):
+                return
 
-            # Obtener colores del tema
-            colors = ThemeManager.get_theme_colors(theme)
-            palette = ThemeManager.apply_theme_to_palette(theme)
-            css_styles = ThemeManager.get_css_styles(theme, font_size)
-
-            # Aplicar paleta y CSS al diálogo PRIMERO
-            self.setPalette(palette)
-            self.setStyleSheet(css_styles)
-
-            # Aplicar estilos a título y stats con colores del tema
-            if hasattr(self, "title_label") and self.title_label:
-                self.title_label.setStyleSheet(f"""
-                    QLabel {{
-                        font-size: 18px;
-                        font-weight: bold;
-                        color: {colors["text_primary"]} !important;
-                        padding: 15px;
-                        text-align: center;
-                        background-color: {colors["surface"]} !important;
-                        border-radius: 8px;
-                        margin-bottom: 10px;
-                    }}
-                """)
-
-            if hasattr(self, "stats_label") and self.stats_label:
-                self.stats_label.setStyleSheet(f"""
-                    QLabel {{
-                        color: {colors["text_secondary"]} !important;
-                        font-size: 12px;
-                        padding: 8px;
-                        text-align: center;
-                        background-color: {colors["surface"]} !important;
-                        border-radius: 6px;
-                        border: 1px solid {colors["border"]} !important;
-                    }}
-                """)
-
-            # Aplicar estilos específicos a QListWidget (listas de categorías y extensiones)
-            if hasattr(self, "categories_list") and self.categories_list:
-                self.categories_list.setStyleSheet(f"""
-                    QListWidget {{
-                        background-color: {colors["surface"]} !important;
-                        color: {colors["text_primary"]} !important;
-                        border: 1px solid {colors["border"]} !important;
-                        border-radius: 8px;
-                        padding: 4px;
-                    }}
-                    QListWidget::item {{
-                        background-color: {colors["surface"]} !important;
-                        color: {colors["text_primary"]} !important;
-                        padding: 6px;
-                        border-radius: 4px;
-                    }}
-                    QListWidget::item:selected {{
-                        background-color: {colors["primary"]} !important;
-                        color: white !important;
-                    }}
-                    QListWidget::item:hover {{
-                        background-color: {colors.get("button_hover", colors["secondary"])} !important;
-                        color: white !important;
-                    }}
-                """)
-
-            if hasattr(self, "extensions_list") and self.extensions_list:
-                self.extensions_list.setStyleSheet(f"""
-                    QListWidget {{
-                        background-color: {colors["surface"]} !important;
-                        color: {colors["text_primary"]} !important;
-                        border: 1px solid {colors["border"]} !important;
-                        border-radius: 8px;
-                        padding: 4px;
-                    }}
-                    QListWidget::item {{
-                        background-color: {colors["surface"]} !important;
-                        color: {colors["text_primary"]} !important;
-                        padding: 6px;
-                        border-radius: 4px;
-                    }}
-                    QListWidget::item:selected {{
-                        background-color: {colors["primary"]} !important;
-                        color: white !important;
-                    }}
-                    QListWidget::item:hover {{
-                        background-color: {colors.get("button_hover", colors["secondary"])} !important;
-                        color: white !important;
-                    }}
-                """)
-
-            # Aplicar a todos los widgets hijos de forma más completa
-            for widget in self.findChildren(QWidget):
-                try:
-                    widget.setPalette(palette)
-                    # Para GroupBox, Labels, ComboBox, etc., aplicar estilos del tema
-                    if isinstance(widget, (QGroupBox, QLabel, QComboBox)):
-                        # Aplicar estilos del tema pero mantener funcionalidad
-                        widget.setStyleSheet(css_styles)
-                    elif isinstance(widget, QPushButton):
-                        # Los botones ya tienen estilos en el CSS global, solo aplicar paleta
-                        widget.setPalette(palette)
-                    elif isinstance(widget, QListWidget):
-                        # QListWidget ya tiene estilos específicos arriba, solo aplicar paleta
-                        widget.setPalette(palette)
-                    else:
-                        # Otros widgets: aplicar CSS si no tiene estilos personalizados
-                        current_style = widget.styleSheet() or ""
-                        if not current_style or "!important" not in current_style:
-                            widget.setStyleSheet(css_styles)
-                except:
-                    pass
-
-            # Refrescar las listas para aplicar nuevos colores a los items
-            # Guardar categoría seleccionada antes de refrescar
-            current_category = None
-            if hasattr(self, "categories_list") and self.categories_list.currentItem():
-                current_category = self.categories_list.currentItem().text()
-
-            # Refrescar lista de categorías
-            self.refresh_categories_list()
-
-            # Restaurar selección si había una
-            if current_category:
-                for i in range(self.categories_list.count()):
-                    item = self.categories_list.item(i)
-                    if item and item.text() == current_category:
-                        self.categories_list.setCurrentItem(item)
-                        self.refresh_extensions_list(current_category)
-                        break
-
-            # Forzar actualización completa
-            self.update()
-            self.repaint()
-
-            # Procesar eventos para asegurar que se apliquen los cambios
-            from PyQt6.QtWidgets import QApplication
-
-            app = QApplication.instance()
-            if app:
-                app.processEvents()
+            # Sin repintados intermedios mientras cambian paleta, hoja y
+            # listas; al reactivarlos Qt programa un único update()
+            self.setUpdatesEnabled(False)
+            try:
+                palette = ThemeManager.apply_theme_to_palette(theme)
+
+                # Aplicar paleta y CSS al diálogo una sola vez
+                self.setPalette(palette)
+                self.setStyleSheet(_build_dialog_css(theme, font_size))
+                self._applied_theme = (theme, font_size)
+
+                # Refrescar las listas solo si sus colores son de otro tema: un
+                # cambio de tamaño de fuente, o la primera aplicación tras
+                # construir la interfaz, no necesita reconstruirlas
+                if self._lists_theme != theme:
+                    # Las filas se recolorean en su sitio: la selección se
+                    # conserva y no hay que restaurarla
+                    self.refresh_categories_list(reload_names=False)
+                    fg = self._get_theme_qcolor("text_primary")
+                    for row in range(self.extensions_list.count()):
+                        self.extensions_list.item(row).setForeground(fg)
+            finally:
+                self.setUpdatesEnabled(True)
 
         except Exception as e:
-            from src.utils.logger import error
-
             error(f"Error aplicando tema al diálogo de configuración: {e}")
             # Fallback al método anterior
             self._apply_theme_fallback()
@@ -966,8 +1084,6 @@ class ConfigDialog(QDialog):
     def _apply_theme_fallback(self):
         """Método de respaldo para aplicar tema"""
         try:
-            from src.utils.themes import ThemeManager
-
             theme = self.app_config.get_theme()
             font_size = self.app_config.get_font_size()
 
@@ -975,28 +1091,17 @@ class ConfigDialog(QDialog):
             palette = ThemeManager.apply_theme_to_palette(theme)
             css_styles = ThemeManager.get_css_styles(theme, font_size)
 
-            # Aplicar al diálogo
-            self.setPalette(palette)
-            self.setStyleSheet(css_styles)
-
-            # Aplicar a todos los widgets hijos (respetando estilos personalizados)
-            for widget in self.findChildren(QWidget):
-                try:
-                    widget.setPalette(palette)
-                    # Solo aplicar CSS si no tiene estilos personalizados con !important
-                    current_style = widget.styleSheet() or ""
-                    if not current_style or "!important" not in current_style:
-                        widget.setStyleSheet(css_styles)
-                except:
-                    pass
-
-            # Forzar actualización visual
-            self.update()
-            self.repaint()
+            # Aplicar al diálogo: ningún hijo tiene hoja ni paleta propias, así
+            # que las heredan sin recorrer el árbol de widgets. Al reactivar
+            # las actualizaciones Qt programa un único repintado en cola
+            self.setUpdatesEnabled(False)
+            try:
+                self.setPalette(palette)
+                self.setStyleSheet(css_styles)
+            finally:
+                self.setUpdatesEnabled(True)
 
         except Exception as e:
-            from src.utils.logger import error
-
             error(f"Error en método de respaldo: {e}")
 
     def focus_exclusions_section(self):
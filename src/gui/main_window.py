@@ -980,6 +980,7 @@ class FileOrganizerGUI(QMainWindow):
             )
             analysis_worker.analysis_complete.connect(self.on_analysis_complete)
             analysis_worker.error_occurred.connect(self.on_analysis_error)
+            analysis_worker.analysis_cancelled.connect(self.on_analysis_cancelled)
 
             # Conectar señal de finalización para limpiar el worker
             analysis_worker.finished.connect(
@@ -1055,6 +1056,18 @@ class FileOrganizerGUI(QMainWindow):
             # Inicializar estadisticas de seleccion (sin elementos seleccionados)
             self.update_selected_statistics()
 
+    def on_analysis_cancelled(self):
+        """Restaura la interfaz cuando el análisis se detiene sin resultados"""
+        # Habilitar botones
+        self.analyze_btn.setEnabled(True)
+        self.update_selection_count()
+
+        # Ocultar progreso
+        self.progress_bar.setVisible(False)
+        if self.current_analysis_task_id:
+            task_registry.finish_task(self.current_analysis_task_id, "Cancelada")
+            self.current_analysis_task_id = None
+
     def on_analysis_error(self, error_message):
         """Maneja errores durante el análisis"""
         self.log_message(error_message)
@@ -1785,9 +1798,18 @@ class FileOrganizerGUI(QMainWindow):
         animation.start()
 
     def _handle_task_progress(self, task_id: str, message: str):
-        """Actualiza task center y log."""
-        task_registry.update_task(task_id, message)
-        self.log_message(message)
+        """Actualiza task center y log.
+
+        Los workers agrupan el progreso en lotes separados por saltos de
+        línea: cada mensaje va al log por separado, con su hora y su color, y
+        el task center muestra solo el último.
+        """
+        lines = [line for line in message.split("\n") if line]
+        if not lines:
+            return
+        task_registry.update_task(task_id, lines[-1])
+        for line in lines:
+            self.log_message(line)
 
     def apply_theme_and_font_together(self, theme_name: str, font_size: int):
         """Aplica tema y fuente JUNTOS usando FastThemeApplier con precarga de caché"""
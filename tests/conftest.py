@@ -0,0 +1,23 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def pytest_sessionstart(session):
+    # Algunos módulos crean su base SQLite con ruta relativa al importarse
+    # (p. ej. media_index.db): la sesión corre en un directorio temporal para
+    # que no aparezcan en la raíz del repositorio
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    session.config._ordenasion_cwd = os.getcwd()
+    session.config._ordenasion_tmp = tempfile.mkdtemp(prefix="ordenasion-tests-")
+    os.chdir(session.config._ordenasion_tmp)
+
+
+def pytest_sessionfinish(session):
+    os.chdir(session.config._ordenasion_cwd)
+    shutil.rmtree(session.config._ordenasion_tmp, ignore_errors=True)
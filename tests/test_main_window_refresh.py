@@ -35,3 +35,32 @@ def test_schedule_post_organization_refresh_triggers_analysis(monkeypatch, tmp_p
     assert scheduled["delay"] == 150
     assert scheduled["callback"] == fake_self.start_analysis
     assert logs[-1] == "🔄 Refrescando resultados tras la organización..."
+
+
+def test_handle_task_progress_logs_each_batched_message(monkeypatch):
+    logs = []
+    updates = []
+    fake_self = SimpleNamespace(log_message=lambda message: logs.append(message))
+    monkeypatch.setattr(
+        main_window_module.task_registry,
+        "update_task",
+        lambda task_id, message: updates.append((task_id, message)),
+    )
+    batch = "\n".join(
+        [
+            "✅ Carpeta analizada: Fotos",
+            "⚠️ Sin permisos para acceder a Sistema",
+            "❌ Error moviendo archivo: a.txt",
+        ]
+    )
+
+    main_window_module.FileOrganizerGUI._handle_task_progress(
+        fake_self, "task-1", batch
+    )
+
+    assert logs == [
+        "✅ Carpeta analizada: Fotos",
+        "⚠️ Sin permisos para acceder a Sistema",
+        "❌ Error moviendo archivo: a.txt",
+    ]
+    assert updates == [("task-1", "❌ Error moviendo archivo: a.txt")]
@@ -31,3 +31,18 @@ def test_resolve_destination_supports_rename_skip_and_overwrite(tmp_path):
     assert rename.destination.name == "file (1).txt"
     assert skip.action == "skip"
     assert overwrite.action == "overwrite"
+
+
+def test_resolve_destination_uses_custom_exists_predicate(tmp_path):
+    taken = {"file.txt", "file (1).txt"}
+
+    def exists(path):
+        return path.name in taken
+
+    resolution = resolve_destination(
+        tmp_path / "file.txt", CONFLICT_POLICY_RENAME, exists=exists
+    )
+
+    assert resolution.action == "rename"
+    assert resolution.destination == tmp_path / "file (2).txt"
+    assert find_available_name(tmp_path / "other.txt", exists) == tmp_path / "other.txt"
@@ -0,0 +1,354 @@
+import errno
+import json
+from datetime import date, datetime
+
+import src.core.transaction_manager as transaction_manager_module
+from src.core.transaction_manager import TransactionManager
+
+
+def _make_file(path, content="data"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_statistics_count_logged_operations(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    source = _make_file(tmp_path / "src" / "a.txt")
+
+    manager.begin_transaction("test")
+    assert manager.safe_move_file(source, tmp_path / "dst" / "a.txt")
+    assert manager.safe_rename_file(tmp_path / "dst" / "a.txt", "b.txt")
+    manager.commit_transaction()
+
+    stats = manager.get_statistics()
+
+    assert stats["move_operations"] == 1
+    assert stats["rename_operations"] == 1
+    assert stats["delete_operations"] == 0
+    assert stats["total_operations"] == 2
+    assert stats["transactions_count"] == 1
+
+
+def test_statistics_survive_reload(tmp_path):
+    log_file = str(tmp_path / "operations_log.json")
+    manager = TransactionManager(log_file)
+    source = _make_file(tmp_path / "src" / "a.txt")
+
+    manager.begin_transaction("test")
+    manager.safe_move_file(source, tmp_path / "dst" / "a.txt")
+    manager.commit_transaction()
+    manager.rollback_transaction(manager.operations[0]["transaction_id"])
+
+    stats = TransactionManager(log_file).get_statistics()
+
+    assert stats["move_operations"] == 1
+    assert stats["rollbacks_performed"] == 1
+    assert stats["transactions_count"] == 1
+
+
+def test_rollback_only_reverts_requested_transaction(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    first = _make_file(tmp_path / "src" / "first.txt")
+    second = _make_file(tmp_path / "src" / "second.txt")
+
+    first_txn = manager.begin_transaction("first")
+    manager.safe_move_file(first, tmp_path / "dst" / "first.txt")
+    manager.commit_transaction()
+    manager.begin_transaction("second")
+    manager.safe_move_file(second, tmp_path / "dst" / "second.txt")
+    manager.commit_transaction()
+
+    assert manager.rollback_transaction(first_txn)
+
+    assert first.exists()
+    assert not second.exists()
+    assert (tmp_path / "dst" / "second.txt").exists()
+
+
+def test_safe_move_file_falls_back_to_copy_across_devices(tmp_path, monkeypatch):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    source = _make_file(tmp_path / "src" / "a.txt", "payload")
+    destination = tmp_path / "dst" / "a.txt"
+
+    def fake_replace(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(transaction_manager_module.os, "replace", fake_replace)
+
+    assert manager.safe_move_file(source, destination)
+    assert not source.exists()
+    assert destination.read_text(encoding="utf-8") == "payload"
+
+
+def test_safe_delete_file_without_trash_uses_quarantine(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    target = _make_file(tmp_path / "data" / "a.txt")
+    _make_file(tmp_path / "data" / ".quarantine" / "a.txt")
+
+    assert manager.safe_delete_file(target, use_trash=False)
+
+    assert not target.exists()
+    assert (tmp_path / "data" / ".quarantine" / "a_1.txt").exists()
+    assert manager.operations[-1]["details"]["path"] == str(target)
+
+
+def test_clear_old_logs_handles_entries_without_epoch(tmp_path):
+    log_file = tmp_path / "operations_log.json"
+    log_file.write_text(
+        json.dumps(
+            {
+                "operations": [
+                    {
+                        "type": "move",
+                        "transaction_id": "txn_old",
+                        "timestamp": "2001-01-01T00:00:00",
+                        "details": {},
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = TransactionManager(str(log_file))
+    source = _make_file(tmp_path / "src" / "a.txt")
+    manager.safe_move_file(source, tmp_path / "dst" / "a.txt")
+
+    manager.clear_old_logs(days_old=30)
+
+    assert all(op.get("transaction_id") != "txn_old" for op in manager.operations)
+    assert manager.get_statistics()["move_operations"] == 1
+    assert not log_file.exists()
+    assert [shard.name[-14:-6] for shard in tmp_path.glob("operations_log.*.jsonl")] == [
+        f"{date.today():%Y%m%d}"
+    ]
+
+
+def test_log_is_appended_as_jsonl_and_reloaded(tmp_path):
+    log_file = tmp_path / "operations_log.json"
+    manager = TransactionManager(str(log_file))
+    source = _make_file(tmp_path / "src" / "a.txt")
+
+    manager.begin_transaction("jsonl")
+    manager.safe_move_file(source, tmp_path / "dst" / "a.txt")
+    manager.commit_transaction()
+
+    shards = sorted(tmp_path.glob("operations_log.*.jsonl"))
+    lines = shards[-1].read_text(encoding="utf-8").splitlines()
+    reloaded = TransactionManager(str(log_file))
+
+    assert [json.loads(line)["type"] for line in lines] == [
+        "transaction_begin",
+        "create_dir",
+        "move",
+        "transaction_commit",
+    ]
+    assert reloaded.operations == manager.operations
+
+
+def test_safe_delete_file_uses_trash_callable(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    target = _make_file(tmp_path / "data" / "a.txt")
+    trashed = []
+    manager._send2trash = trashed.append
+
+    assert manager.safe_delete_file(target, use_trash=True)
+
+    assert trashed == [str(target)]
+    assert manager.operations[-1]["details"]["operation_type"] == "delete_to_trash"
+
+
+def test_operations_are_written_when_transaction_commits(tmp_path):
+    log_file = str(tmp_path / "operations_log.json")
+    manager = TransactionManager(log_file)
+    source = _make_file(tmp_path / "src" / "a.txt")
+
+    manager.begin_transaction("batch")
+    manager.safe_move_file(source, tmp_path / "dst" / "a.txt")
+
+    assert TransactionManager(log_file).get_statistics()["move_operations"] == 0
+
+    manager.commit_transaction()
+
+    assert TransactionManager(log_file).get_statistics()["move_operations"] == 1
+
+
+def test_rollback_reads_evicted_operations_from_disk(tmp_path):
+    manager = TransactionManager(
+        str(tmp_path / "operations_log.json"), max_operations_in_memory=4
+    )
+    (tmp_path / "dst").mkdir()
+    sources = [_make_file(tmp_path / "src" / f"{index}.txt") for index in range(5)]
+
+    txn_id = manager.begin_transaction("big")
+    for source in sources:
+        assert manager.safe_move_file(source, tmp_path / "dst" / source.name)
+    manager.commit_transaction()
+
+    assert len(manager.operations) == 4
+    assert manager.get_statistics()["move_operations"] == 5
+    assert manager.rollback_transaction(txn_id)
+    assert all(source.exists() for source in sources)
+
+
+def test_transaction_history_lists_newest_first_with_operations(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    (tmp_path / "dst").mkdir()
+
+    for name in ("first", "second", "third"):
+        source = _make_file(tmp_path / "src" / f"{name}.txt")
+        manager.begin_transaction(name)
+        manager.safe_move_file(source, tmp_path / "dst" / source.name)
+        manager.commit_transaction()
+
+    history = manager.get_transaction_history(limit=2)
+
+    assert [txn["description"] for txn in history] == ["third", "second"]
+    assert [op["type"] for op in history[0]["operations"]] == ["move"]
+
+
+def test_empty_transaction_is_not_written(tmp_path):
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+
+    manager.begin_transaction("dry run")
+    assert manager.commit_transaction()
+
+    assert len(manager.operations) == 0
+    assert list(tmp_path.glob("operations_log.*.jsonl")) == []
+    assert manager.get_statistics()["transactions_count"] == 0
+
+
+def test_concurrent_moves_are_all_logged(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    (tmp_path / "dst").mkdir()
+    sources = [_make_file(tmp_path / "src" / f"{index}.txt") for index in range(40)]
+
+    txn_id = manager.begin_transaction("parallel")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda source: manager.safe_move_file(
+                    source, tmp_path / "dst" / source.name
+                ),
+                sources,
+            )
+        )
+    manager.commit_transaction()
+
+    assert all(results)
+    assert manager.get_statistics()["move_operations"] == 40
+    assert manager.rollback_transaction(txn_id)
+    assert all(source.exists() for source in sources)
+
+
+def _write_legacy_log(path, newline):
+    legacy = {
+        "operations": [
+            {
+                "type": "transaction_begin",
+                "transaction_id": "txn_legacy",
+                "timestamp": datetime.now().isoformat(),
+                "description": "legacy",
+            },
+            {
+                "type": "move",
+                "transaction_id": "txn_legacy",
+                "timestamp": datetime.now().isoformat(),
+                "details": {},
+            },
+        ]
+    }
+    text = json.dumps(legacy, indent=2).replace("\n", newline)
+    path.write_bytes(text.encode("utf-8"))
+
+
+def test_crlf_legacy_log_is_migrated(tmp_path):
+    log_file = tmp_path / "operations_log.json"
+    _write_legacy_log(log_file, "\r\n")
+
+    stats = TransactionManager(str(log_file)).get_statistics()
+
+    assert stats["move_operations"] == 1
+    assert stats["transactions_count"] == 1
+    assert not log_file.exists()
+
+
+def test_legacy_log_is_kept_when_nothing_migrates(tmp_path):
+    log_file = tmp_path / "operations_log.json"
+    log_file.write_text('{\r\n  "operations": [\r\n', encoding="utf-8")
+
+    TransactionManager(str(log_file))
+
+    assert log_file.exists()
+    assert list(tmp_path.glob("operations_log.*.jsonl")) == []
+
+
+def test_legacy_migration_is_not_duplicated_when_unlink_failed(tmp_path):
+    log_file = tmp_path / "operations_log.json"
+    _write_legacy_log(log_file, "\n")
+    legacy = log_file.read_bytes()
+    TransactionManager(str(log_file))
+    # Simula un borrado fallido: el fichero antiguo sigue ahí al reiniciar
+    log_file.write_bytes(legacy)
+
+    stats = TransactionManager(str(log_file)).get_statistics()
+
+    assert stats["move_operations"] == 1
+    assert not log_file.exists()
+
+
+def test_transaction_index_is_pruned_after_eviction(tmp_path):
+    manager = TransactionManager(
+        str(tmp_path / "operations_log.json"), max_operations_in_memory=4
+    )
+    (tmp_path / "dst").mkdir()
+
+    for index in range(20):
+        source = _make_file(tmp_path / "src" / f"{index}.txt")
+        manager.begin_transaction(str(index))
+        manager.safe_move_file(source, tmp_path / "dst" / source.name)
+        manager.commit_transaction()
+
+    first = manager._first_position()
+    positions = [p for ps in manager._by_txn.values() for p in ps]
+    assert min(positions) >= first - 4
+    assert min(manager._txn_begin.values()) >= first - 4
+
+
+def test_clear_old_logs_filters_unsorted_cutoff_day(tmp_path, monkeypatch):
+    log_file = tmp_path / "operations_log.json"
+    now = 1_700_000_000.0
+    cutoff = now - 30 * 86400
+    shard = tmp_path / f"operations_log.{date.fromtimestamp(cutoff):%Y%m%d}.jsonl"
+    # Entradas de dos gestores intercaladas fuera de orden
+    entries = [
+        {"type": "move", "transaction_id": "b", "ts": cutoff + 1, "details": {}},
+        {"type": "move", "transaction_id": "a", "ts": cutoff - 1, "details": {}},
+        {"type": "move", "transaction_id": "c", "ts": cutoff + 2, "details": {}},
+    ]
+    shard.write_text("".join(json.dumps(op) + "\n" for op in entries), encoding="utf-8")
+    monkeypatch.setattr(transaction_manager_module.time, "time", lambda: now)
+    manager = TransactionManager(str(log_file))
+
+    manager.clear_old_logs(days_old=30)
+
+    kept = [json.loads(line) for line in shard.read_text(encoding="utf-8").splitlines()]
+    assert [op["transaction_id"] for op in kept] == ["b", "c"]
+
+
+def test_last_error_is_per_thread(tmp_path):
+    import threading
+
+    manager = TransactionManager(str(tmp_path / "operations_log.json"))
+    thread = threading.Thread(
+        target=manager.safe_move_file,
+        args=(tmp_path / "missing.txt", tmp_path / "dst" / "missing.txt"),
+    )
+    thread.start()
+    thread.join()
+
+    assert manager.last_error is None
+    assert not manager.safe_move_file(tmp_path / "missing.txt", tmp_path / "x.txt")
+    assert "missing.txt" in manager.last_error